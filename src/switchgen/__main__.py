@@ -2,15 +2,15 @@
 
 import sys
 
-from .core.logging import get_logger, setup_logging
-
-# Initialize logging before anything else
-setup_logging()
-logger = get_logger(__name__)
-
 
 def main():
     """Main entry point for SwitchGen."""
+    # Imported here so that `import switchgen.__main__` stays cheap; logging is
+    # still initialized before anything else runs.
+    from .core.logging import get_logger, setup_logging
+
+    setup_logging()
+    logger = get_logger(__name__)
     logger.info("SwitchGen starting (Python %s)", sys.version.split()[0])
 
     # Check for test mode
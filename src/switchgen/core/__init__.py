@@ -17,6 +17,7 @@ from .engine import (
     ProgressInfo,
     get_engine,
     tensor_to_pil,
+    tensor_to_uint8,
 )
 from .queue import GenerationJob, GenerationQueue
 from .workflows import (
@@ -61,6 +62,7 @@ __all__ = [
     "ProgressInfo",
     "get_engine",
     "tensor_to_pil",
+    "tensor_to_uint8",
     # Config
     "Config",
     "get_config",
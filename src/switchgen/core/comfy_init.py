@@ -19,7 +19,6 @@ os.environ["CUDA_MODULE_LOADING"] = "LAZY"
 #    (essential when switching between different image sizes/models)
 os.environ["PYTORCH_CUDA_ALLOC_CONF"] = "expandable_segments:True"
 
-import asyncio
 import sys
 import threading
 from collections.abc import Callable
@@ -175,6 +174,8 @@ def _load_node_registry(config: Config, load_custom_nodes: bool = True) -> dict:
     Custom nodes and comfy_extras require calling nodes.init_extra_nodes()
     which is ASYNC and must run in an asyncio event loop.
     """
+    import asyncio
+
     # CRITICAL: Create and set an event loop for this thread BEFORE importing nodes
     # Some custom nodes check for an event loop during import
     try:
@@ -276,6 +277,8 @@ def initialize_comfy(config: Config | None = None, load_custom_nodes: bool = Tru
 
     ctx = ComfyContext()
 
+    import asyncio
+
     try:
         # CRITICAL: Ensure this thread has an event loop
         # Some custom nodes check for an event loop during import
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 import os
+import threading
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -17,15 +19,18 @@ except ModuleNotFoundError:
 
 logger = logging.getLogger(__name__)
 
+# This file is at: switchgen/src/switchgen/core/config.py
+# Root is 4 levels up: config.py -> core -> switchgen -> src -> switchgen_root
+# Resolved once at import; the file location cannot change during the process.
+_SWITCHGEN_ROOT = Path(__file__).resolve().parent.parent.parent.parent
+
 
 def _detect_switchgen_root() -> Path:
     """Detect SwitchGen root directory relative to this file.
 
     This is primarily used for development mode where we run from the repo.
     """
-    # This file is at: switchgen/src/switchgen/core/config.py
-    # Root is 4 levels up: config.py -> core -> switchgen -> src -> switchgen_root
-    return Path(__file__).resolve().parent.parent.parent.parent
+    return _SWITCHGEN_ROOT
 
 
 def _get_data_root() -> Path:
@@ -41,29 +46,42 @@ def _get_data_root() -> Path:
     return base / "switchgen"
 
 
+# System installation location (AUR package installs here)
+_SYSTEM_COMFY_PATH = "/usr/share/switchgen/vendor/ComfyUI"
+
+
+@functools.lru_cache(maxsize=1)
 def _detect_comfy_path() -> Path:
-    """Detect ComfyUI path - system install, bundled, or environment override."""
+    """Detect ComfyUI path - system install, bundled, or environment override.
+
+    The result is cached for the process lifetime; call
+    ``_detect_comfy_path.cache_clear()`` to force re-detection.
+    """
+
+    # Candidates are probed as plain strings with os.path; only the selected
+    # directory is wrapped in a Path.
 
     # 1. Check environment variable first (highest priority)
     env_path = os.environ.get("COMFYUI_PATH")
     if env_path:
-        path = Path(env_path)
-        if path.exists():
-            logger.info("Using ComfyUI from COMFYUI_PATH: %s", path)
-            return path
+        if os.path.isdir(env_path):
+            logger.info("Using ComfyUI from COMFYUI_PATH: %s", env_path)
+            return Path(env_path)
         logger.warning("COMFYUI_PATH set but path does not exist: %s", env_path)
 
     # 2. Check system installation (AUR package installs here)
-    system_path = Path("/usr/share/switchgen/vendor/ComfyUI")
-    if system_path.exists():
-        logger.debug("Using system ComfyUI at %s", system_path)
-        return system_path
+    system_path = _SYSTEM_COMFY_PATH
+    if os.path.isdir(system_path):
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Using system ComfyUI at %s", system_path)
+        return Path(system_path)
 
     # 3. Check development/bundled location
-    dev_path = _detect_switchgen_root() / "vendor" / "ComfyUI"
-    if dev_path.exists():
-        logger.debug("Using bundled ComfyUI at %s", dev_path)
-        return dev_path
+    dev_path = os.path.join(_detect_switchgen_root(), "vendor", "ComfyUI")
+    if os.path.isdir(dev_path):
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Using bundled ComfyUI at %s", dev_path)
+        return Path(dev_path)
 
     # 4. Error: ComfyUI not found
     logger.error("ComfyUI not found in system or development paths")
@@ -82,22 +100,41 @@ def _get_effective_data_root() -> Path:
     - System install: Use XDG data directory (~/.local/share/switchgen/)
     """
     dev_root = _detect_switchgen_root()
-    dev_comfy = dev_root / "vendor" / "ComfyUI"
+    # Runs for every PathConfig(); skip log-record creation when DEBUG is off
+    debug = logger.isEnabledFor(logging.DEBUG)
 
-    if dev_comfy.exists():
+    if os.path.isdir(os.path.join(dev_root, "vendor", "ComfyUI")):
         # Development mode - use repo root for data
-        logger.debug("Development mode: using repo root for data: %s", dev_root)
+        if debug:
+            logger.debug("Development mode: using repo root for data: %s", dev_root)
         return dev_root
     else:
         # System installation - use XDG data directory
         data_root = _get_data_root()
-        logger.debug("System install: using XDG data root: %s", data_root)
+        if debug:
+            logger.debug("System install: using XDG data root: %s", data_root)
         return data_root
 
 
-@dataclass
+# Directory names under data_root / models_dir
+_OUTPUT = "output"
+_TEMP = "temp"
+_INPUT = "input"
+_WORKFLOWS = "workflows"
+_MODELS = "models"
+_CUSTOM_NODES = "custom_nodes"
+# Model subdirectories exposed as PathConfig.*_dir and created up front
+_MODEL_SUBDIRS = ("checkpoints", "loras", "vae", "clip", "controlnet", "embeddings")
+
+
+@dataclass(slots=True, frozen=True)
 class PathConfig:
-    """Path configuration for ComfyUI and SwitchGen."""
+    """Path configuration for ComfyUI and SwitchGen.
+
+    Derived directories are computed once in ``__post_init__`` and stored as
+    plain attributes, so hot-path access does not rebuild ``Path`` objects.
+    The instance is frozen (and therefore hashable) once constructed.
+    """
 
     # ComfyUI installation path (for engine and custom nodes)
     comfy_path: Path = field(default_factory=_detect_comfy_path)
@@ -111,66 +148,71 @@ class PathConfig:
     switchgen_root: Path = field(default_factory=_detect_switchgen_root)
 
     # User data directories (all under data_root)
-    @property
-    def output_dir(self) -> Path:
-        return self.data_root / "output"
-
-    @property
-    def temp_dir(self) -> Path:
-        return self.data_root / "temp"
-
-    @property
-    def input_dir(self) -> Path:
-        return self.data_root / "input"
-
-    @property
-    def workflows_dir(self) -> Path:
-        return self.data_root / "workflows"
+    output_dir: Path = field(init=False)
+    temp_dir: Path = field(init=False)
+    input_dir: Path = field(init=False)
+    workflows_dir: Path = field(init=False)
 
     # Model directories (under data_root/models)
-    @property
-    def models_dir(self) -> Path:
-        return self.data_root / "models"
-
-    @property
-    def checkpoints_dir(self) -> Path:
-        return self.models_dir / "checkpoints"
+    models_dir: Path = field(init=False)
+    checkpoints_dir: Path = field(init=False)
+    loras_dir: Path = field(init=False)
+    vae_dir: Path = field(init=False)
+    clip_dir: Path = field(init=False)
+    controlnet_dir: Path = field(init=False)
+    embeddings_dir: Path = field(init=False)
 
-    @property
-    def loras_dir(self) -> Path:
-        return self.models_dir / "loras"
-
-    @property
-    def vae_dir(self) -> Path:
-        return self.models_dir / "vae"
+    # Custom nodes directory (in ComfyUI installation)
+    custom_nodes_dir: Path = field(init=False)
+
+    def __post_init__(self) -> None:
+        # Roots are kept as configured (symlinks and relative paths included).
+        # Derived paths are built from plain strings: one Path parse each
+        # instead of a chain of "/" joins.
+        data = os.fspath(self.data_root)
+        models = os.path.join(data, _MODELS)
+        derived = {
+            "output_dir": os.path.join(data, _OUTPUT),
+            "temp_dir": os.path.join(data, _TEMP),
+            "input_dir": os.path.join(data, _INPUT),
+            "workflows_dir": os.path.join(data, _WORKFLOWS),
+            "models_dir": models,
+            "checkpoints_dir": os.path.join(models, "checkpoints"),
+            "loras_dir": os.path.join(models, "loras"),
+            "vae_dir": os.path.join(models, "vae"),
+            "clip_dir": os.path.join(models, "clip"),
+            "controlnet_dir": os.path.join(models, "controlnet"),
+            "embeddings_dir": os.path.join(models, "embeddings"),
+            "custom_nodes_dir": os.path.join(os.fspath(self.comfy_path), _CUSTOM_NODES),
+        }
+        # Frozen dataclass: bypass __setattr__ for the one-time initialisation
+        for name, value in derived.items():
+            object.__setattr__(self, name, Path(value))
 
-    @property
-    def clip_dir(self) -> Path:
-        return self.models_dir / "clip"
+    def ensure_directories(self) -> None:
+        """Create all data and model-type directories if they don't exist.
 
-    @property
-    def controlnet_dir(self) -> Path:
-        return self.models_dir / "controlnet"
+        Each parent is listed once, so the usual case where everything
+        already exists costs two directory reads rather than a mkdir per path.
+        """
+        _ensure_children(os.fspath(self.data_root), (_OUTPUT, _TEMP, _INPUT, _WORKFLOWS, _MODELS))
+        _ensure_children(os.fspath(self.models_dir), _MODEL_SUBDIRS)
 
-    @property
-    def embeddings_dir(self) -> Path:
-        return self.models_dir / "embeddings"
 
-    # Custom nodes directory (in ComfyUI installation)
-    @property
-    def custom_nodes_dir(self) -> Path:
-        return self.comfy_path / "custom_nodes"
+def _ensure_children(parent: str, names: tuple[str, ...]) -> None:
+    """Create the named subdirectories of parent that are missing."""
+    try:
+        with os.scandir(parent) as it:
+            existing = {entry.name for entry in it if entry.is_dir()}
+    except FileNotFoundError:
+        existing = set()
 
-    def ensure_directories(self) -> None:
-        """Create all data directories if they don't exist."""
-        self.output_dir.mkdir(parents=True, exist_ok=True)
-        self.temp_dir.mkdir(parents=True, exist_ok=True)
-        self.input_dir.mkdir(parents=True, exist_ok=True)
-        self.workflows_dir.mkdir(parents=True, exist_ok=True)
-        self.models_dir.mkdir(parents=True, exist_ok=True)
+    for name in names:
+        if name not in existing:
+            os.makedirs(os.path.join(parent, name), exist_ok=True)
 
 
-@dataclass
+@dataclass(slots=True)
 class MemoryConfig:
     """Memory management configuration."""
 
@@ -187,7 +229,7 @@ class MemoryConfig:
     vram_critical_threshold: float = 0.95
 
 
-@dataclass
+@dataclass(slots=True)
 class GenerationDefaults:
     """Default generation parameters."""
 
@@ -200,7 +242,7 @@ class GenerationDefaults:
     batch_size: int = 1
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionState:
     """Persisted session state (restored on startup)."""
 
@@ -223,7 +265,7 @@ def _get_config_path() -> Path:
     return base / "switchgen" / "config.toml"
 
 
-@dataclass
+@dataclass(slots=True)
 class Config:
     """Main application configuration."""
 
@@ -373,12 +415,21 @@ def _apply_toml(config: Config, data: dict) -> None:
 
 # Global config instance
 _config: Config | None = None
+_config_lock = threading.Lock()
 
 
 def get_config() -> Config:
-    """Get the global configuration instance."""
+    """Get the global configuration instance.
+
+    Initialization is serialized by a lock so concurrent first calls (e.g. the
+    UI thread and the ComfyUI init thread) still load the config exactly once.
+    """
     global _config
-    if _config is None:
-        logger.debug("Initializing global configuration")
-        _config = Config.load()
-    return _config
+    config = _config
+    if config is None:
+        with _config_lock:
+            if _config is None:
+                logger.debug("Initializing global configuration")
+                _config = Config.load()
+            config = _config
+    return config
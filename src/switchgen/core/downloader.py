@@ -1,27 +1,144 @@
 """Model download manager using HuggingFace Hub."""
 
+import asyncio
+import concurrent.futures
+import functools
+import hashlib
+import importlib.util
 import logging
-import shutil
+import os
 import threading
 import time
+import weakref
 from collections.abc import Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-
-import requests
+from typing import Any
+from urllib.parse import urlsplit
 
 logger = logging.getLogger(__name__)
 
-try:
-    from huggingface_hub import hf_hub_url
-    from huggingface_hub.utils import build_hf_headers
-
-    HF_AVAILABLE = True
-except ImportError:
-    HF_AVAILABLE = False
-    logger.debug("huggingface_hub not available")
+from .models import MODEL_CATALOG, ModelInfo, installed_set
+
+# huggingface_hub and requests are imported on first download rather than at
+# module import; both pull in large dependency trees that startup never needs.
+_hf_cache: dict[str, Any] | None = None
 
-from .models import MODEL_CATALOG, ModelInfo, is_model_installed
+# Concurrent downloads for download_many(); same variable huggingface_hub reads
+_PARALLEL_WORKERS_ENV = "HF_PARALLEL_DOWNLOADING_WORKERS"
+_DEFAULT_PARALLEL_WORKERS = 8
+
+# hf_transfer settings, matching what huggingface_hub passes it
+_HF_TRANSFER_MAX_FILES = 100
+_HF_TRANSFER_CHUNK_SIZE = 10 * 1024 * 1024
+
+# Files at least this large are fetched as parallel HTTP Range slices
+_RANGE_MIN_SIZE = 256 * 1024 * 1024
+_RANGE_CONNECTIONS = 8
+
+
+@functools.lru_cache(maxsize=1)
+def _hf_available() -> bool:
+    """Check whether huggingface_hub is installed, without importing it."""
+    available = importlib.util.find_spec("huggingface_hub") is not None
+    if not available:
+        logger.debug("huggingface_hub not available")
+    return available
+
+
+def _get_hf() -> dict[str, Any]:
+    """Import and cache the huggingface_hub helpers used for downloads."""
+    global _hf_cache
+    if _hf_cache is None:
+        from huggingface_hub import hf_hub_url, try_to_load_from_cache
+        from huggingface_hub.utils import build_hf_headers
+
+        _hf_cache = {
+            "hf_hub_url": hf_hub_url,
+            "build_hf_headers": build_hf_headers,
+            "try_to_load_from_cache": try_to_load_from_cache,
+        }
+    return _hf_cache
+
+
+def _parallel_workers() -> int:
+    """Get the download_many worker count, honouring the environment override."""
+    value = os.environ.get(_PARALLEL_WORKERS_ENV)
+    if not value:
+        return _DEFAULT_PARALLEL_WORKERS
+    try:
+        return max(1, int(value))
+    except ValueError:
+        logger.warning("Ignoring invalid %s=%r", _PARALLEL_WORKERS_ENV, value)
+        return _DEFAULT_PARALLEL_WORKERS
+
+
+@functools.lru_cache(maxsize=1)
+def _hf_transfer_available() -> bool:
+    """Check whether the optional hf_transfer accelerator is installed."""
+    return importlib.util.find_spec("hf_transfer") is not None
+
+
+# posix_fadvise and its POSIX_FADV_* constants only exist on some platforms
+_HAS_FADVISE = hasattr(os, "posix_fadvise")
+
+
+def _fadvise(fd: int, advice: int) -> None:
+    """Apply a whole-file posix_fadvise hint; callers check _HAS_FADVISE first."""
+    try:
+        os.posix_fadvise(fd, 0, 0, advice)
+    except OSError as e:
+        logger.debug("posix_fadvise(%d) failed: %s", advice, e)
+
+
+def _drop_page_cache(path: Path) -> None:
+    """Flush a freshly written file and advise its pages out of the page cache.
+
+    DONTNEED skips dirty pages, hence the fdatasync first. Best-effort: a
+    failure only loses the hint, never the download.
+    """
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError as e:
+        logger.debug("Could not open %s to drop its page cache: %s", path, e)
+        return
+    try:
+        os.fdatasync(fd)
+        _fadvise(fd, os.POSIX_FADV_DONTNEED)
+    except OSError as e:
+        logger.debug("Could not drop page cache for %s: %s", path, e)
+    finally:
+        os.close(fd)
+
+
+def _redirect_headers(headers: dict[str, str], url: str, resolved: str) -> dict[str, str]:
+    """Headers to send to a redirect target.
+
+    The resolved URL is usually a signed third-party CDN link; the Hub token
+    is only sent when the host is unchanged.
+    """
+    if urlsplit(resolved).netloc == urlsplit(url).netloc:
+        return headers
+    return {k: v for k, v in headers.items() if k.lower() != "authorization"}
+
+
+def _file_sha256(path: Path) -> str:
+    """Hash a file already on disk, for downloads that could not hash inline."""
+    h = hashlib.sha256()
+    with open(path, "rb") as fh:
+        if _HAS_FADVISE:
+            _fadvise(fh.fileno(), os.POSIX_FADV_SEQUENTIAL)  # bigger readahead
+        for chunk in iter(lambda: fh.read(1024 * 1024), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _expected_size(headers: Any, model_info: ModelInfo) -> int:
+    """Get the expected download size from response headers or the catalog."""
+    total_size = int(headers.get("content-length", 0))
+    if total_size == 0:
+        total_size = model_info.size_mb * 1024 * 1024  # Fallback to catalog size
+    return total_size
 
 
 class DownloadCancelledException(Exception):
@@ -30,34 +147,37 @@ class DownloadCancelledException(Exception):
     pass
 
 
-@dataclass
+# Weight of the newest sample in the download speed EMA
+_SPEED_EMA_ALPHA = 0.3
+
+
+@dataclass(slots=True, frozen=True)
 class DownloadProgress:
-    """Progress information for a download."""
+    """Progress information for a download.
+
+    Derived values are computed once at construction, since the UI reads
+    several of them for every progress tick.
+    """
 
     model_id: str
     downloaded_bytes: int
     total_bytes: int
     speed_bps: float  # bytes per second
 
-    @property
-    def progress(self) -> float:
-        """Progress as a fraction (0.0 to 1.0)."""
-        if self.total_bytes <= 0:
-            return 0.0
-        return min(1.0, self.downloaded_bytes / self.total_bytes)
-
-    @property
-    def downloaded_mb(self) -> float:
-        return self.downloaded_bytes / (1024 * 1024)
-
-    @property
-    def total_mb(self) -> float:
-        return self.total_bytes / (1024 * 1024)
+    progress: float = field(init=False)  # fraction, 0.0 to 1.0
+    downloaded_mb: float = field(init=False)
+    total_mb: float = field(init=False)
+    speed_mbps: float = field(init=False)  # MB/s
 
-    @property
-    def speed_mbps(self) -> float:
-        """Speed in MB/s."""
-        return self.speed_bps / (1024 * 1024)
+    def __post_init__(self) -> None:
+        if self.total_bytes <= 0:
+            progress = 0.0
+        else:
+            progress = min(1.0, self.downloaded_bytes / self.total_bytes)
+        object.__setattr__(self, "progress", progress)
+        object.__setattr__(self, "downloaded_mb", self.downloaded_bytes / (1024 * 1024))
+        object.__setattr__(self, "total_mb", self.total_bytes / (1024 * 1024))
+        object.__setattr__(self, "speed_mbps", self.speed_bps / (1024 * 1024))
 
     @property
     def eta_seconds(self) -> float | None:
@@ -86,6 +206,101 @@ class DownloadProgress:
             minutes = int((eta % 3600) // 60)
             return f"{hours}h {minutes}m"
 
+    @staticmethod
+    def ema_filter(samples: Any, alpha: float = _SPEED_EMA_ALPHA) -> Any:
+        """Smooth speed samples with the live EMA as a C-level IIR filter.
+
+        Uses scipy.signal.lfilter, which is linear time.
+
+        Args:
+            samples: 1-D sequence of speeds (e.g. bytes per second)
+            alpha: Weight of the newest sample
+
+        Returns:
+            numpy array of smoothed speeds, same length as samples
+        """
+        import numpy as np
+        from scipy.signal import lfilter
+
+        x = np.asarray(samples, dtype=np.float64)
+        if x.size == 0:
+            return x
+
+        # Initial state seeds the average with the first sample
+        smoothed, _ = lfilter([alpha], [1.0, alpha - 1.0], x, zi=[x[0] * (1.0 - alpha)])
+        return smoothed
+
+
+# DownloadResult.error for a download stopped by cancel_download()
+_CANCELLED_ERROR = "Download cancelled"
+
+# Fraction of a queued download after which download_queue starts the next
+_PIPELINE_THRESHOLD = 0.75
+
+# Seconds a disk-space reading is reused
+_DISK_CACHE_TTL = 1.0
+
+# Bytes that must arrive between progress updates before the clock is checked
+_PROGRESS_MIN_BYTES = 256 * 1024
+
+
+class _ProgressReporter:
+    """Turn byte counts into rate-limited DownloadProgress callbacks.
+
+    Safe to advance from several threads at once.
+    """
+
+    def __init__(
+        self,
+        model_id: str,
+        total_bytes: int,
+        callback: Callable[[DownloadProgress], None] | None,
+    ):
+        self.model_id = model_id
+        self.total_bytes = total_bytes
+        self.downloaded = 0
+        self._callback = callback
+        self._lock = threading.Lock()
+        # Monotonic clock: wall-clock jumps (NTP) can't produce negative intervals
+        self._last_update_ns = time.monotonic_ns()
+        self._last_bytes = 0
+        self._smoothed_speed = 0.0
+
+        # Initial progress callback
+        if callback:
+            callback(DownloadProgress(model_id, 0, total_bytes, 0))
+
+    def advance(self, nbytes: int) -> None:
+        """Record nbytes more and emit an update if 250ms have passed."""
+        with self._lock:
+            self.downloaded += nbytes
+            # Cheap byte check first so small chunks skip the clock read
+            if not self._callback or self.downloaded - self._last_bytes < _PROGRESS_MIN_BYTES:
+                return
+
+            now = time.monotonic_ns()
+            elapsed_ns = now - self._last_update_ns
+            if elapsed_ns < 250_000_000:
+                return
+
+            instant_speed = (self.downloaded - self._last_bytes) * 1e9 / elapsed_ns
+
+            # Smooth speed with EMA (alpha 0.3, roughly a 5.7-sample average)
+            if self._smoothed_speed == 0:
+                self._smoothed_speed = instant_speed
+            else:
+                self._smoothed_speed = (
+                    _SPEED_EMA_ALPHA * instant_speed + (1 - _SPEED_EMA_ALPHA) * self._smoothed_speed
+                )
+
+            self._last_update_ns = now
+            self._last_bytes = self.downloaded
+            progress = DownloadProgress(
+                self.model_id, self.downloaded, self.total_bytes, self._smoothed_speed
+            )
+
+        self._callback(progress)
+
 
 @dataclass
 class DownloadResult:
@@ -102,49 +317,97 @@ class ModelDownloader:
 
     def __init__(self, models_dir: Path):
         self.models_dir = models_dir
-        self._current_download: str | None = None
-        self._cancel_requested = False
+        # String form for the os.scandir/os.stat calls made on every refresh
+        self._models_dir_str = os.fspath(models_dir)
+        # Cancel token per in-flight download, keyed by model id
+        self._active: dict[str, threading.Event] = {}
+        self._lock = threading.Lock()
+        # Single worker: downloads queue up rather than competing for bandwidth
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="dl"
+        )
+        # (monotonic time, (free MB, total MB)) from the last statvfs
+        self._disk_cache: tuple[float, tuple[float, float]] | None = None
+        # Model-type subdirectories already created by this downloader
+        self._created_dirs: set[str] = set()
+        # One HTTP session per download thread, so connections to the Hub are
+        # reused without sharing a (not thread-safe) Session across threads
+        self._local = threading.local()
+        # Sessions still alive on some thread, closed on shutdown
+        self._sessions: weakref.WeakSet[Any] = weakref.WeakSet()
+
+    def _get_session(self) -> Any:
+        """Get this thread's requests.Session, creating it on first use."""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            import requests
+
+            session = self._local.session = requests.Session()
+            with self._lock:
+                self._sessions.add(session)
+        return session
 
     def is_available(self) -> bool:
         """Check if HuggingFace Hub is available."""
-        return HF_AVAILABLE
+        return _hf_available()
 
     def get_disk_space_mb(self) -> tuple[float, float]:
-        """Get free and total disk space in MB."""
-        stat = shutil.disk_usage(self.models_dir)
-        free_mb = stat.free / (1024 * 1024)
-        total_mb = stat.total / (1024 * 1024)
+        """Get free and total disk space in MB.
+
+        Results are reused for up to a second, so back-to-back checks (the
+        dialog, then download()) share one statvfs call.
+        """
+        now = time.monotonic()
+        if self._disk_cache is not None and now - self._disk_cache[0] < _DISK_CACHE_TTL:
+            return self._disk_cache[1]
+
+        st = os.statvfs(self._models_dir_str)
+        free_mb = st.f_bavail * st.f_frsize / (1024 * 1024)
+        total_mb = st.f_blocks * st.f_frsize / (1024 * 1024)
+        self._disk_cache = (now, (free_mb, total_mb))
         return free_mb, total_mb
 
-    def check_disk_space(self, size_mb: int) -> bool:
-        """Check if enough disk space is available."""
+    def check_disk_space(self, size_mb: int) -> tuple[bool, float]:
+        """Check if enough disk space is available.
+
+        Returns:
+            (enough space, free MB) so callers can report the figure without
+            querying the filesystem a second time
+        """
         free_mb, _ = self.get_disk_space_mb()
-        # Require 500MB extra headroom
+        return self.has_room_for(size_mb, free_mb), free_mb
+
+    @staticmethod
+    def has_room_for(size_mb: int, free_mb: float) -> bool:
+        """Whether a download of size_mb fits in free_mb, with 500MB headroom."""
         return free_mb >= (size_mb + 500)
 
     def get_installed_models(self) -> list[str]:
-        """Get list of installed model IDs from the catalog."""
-        installed = []
-        for model_id, model_info in MODEL_CATALOG.items():
-            if is_model_installed(model_info, self.models_dir):
-                installed.append(model_id)
-        return installed
+        """Get list of installed model IDs from the catalog.
+
+        One directory scan per model type rather than a stat per catalog entry.
+        """
+        found = installed_set(self.models_dir)
+        return [model_id for model_id in MODEL_CATALOG if model_id in found]
 
     def download(
         self,
         model_info: ModelInfo,
         progress_callback: Callable[[DownloadProgress], None] | None = None,
+        use_hf_transfer: bool | None = None,
     ) -> DownloadResult:
         """Download a model from HuggingFace Hub.
 
         Args:
             model_info: The model to download
             progress_callback: Called with progress updates
+            use_hf_transfer: Use the parallel hf_transfer backend
+                (default: whenever it is installed)
 
         Returns:
             DownloadResult with success status and path or error
         """
-        if not HF_AVAILABLE:
+        if not _hf_available():
             logger.error("huggingface_hub not installed")
             return DownloadResult(
                 success=False,
@@ -152,9 +415,11 @@ class ModelDownloader:
                 error="huggingface_hub not installed. Run: pip install huggingface_hub",
             )
 
+        import requests
+
         # Check disk space
-        if not self.check_disk_space(model_info.size_mb):
-            free_mb, _ = self.get_disk_space_mb()
+        has_space, free_mb = self.check_disk_space(model_info.size_mb)
+        if not has_space:
             logger.error(
                 "Not enough disk space for %s: need %dMB, have %.0fMB",
                 model_info.name,
@@ -167,15 +432,24 @@ class ModelDownloader:
                 error=f"Not enough disk space. Need {model_info.size_mb}MB, have {free_mb:.0f}MB free",
             )
 
-        # Prepare target directory
+        # Prepare target directory (once per model type for this downloader)
         target_dir = self.models_dir / model_info.type.value
-        target_dir.mkdir(parents=True, exist_ok=True)
+        if model_info.type.value not in self._created_dirs:
+            target_dir.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(model_info.type.value)
 
         local_filename = model_info.get_local_filename()
         target_path = target_dir / local_filename
 
-        self._current_download = model_info.id
-        self._cancel_requested = False
+        cancel = threading.Event()
+        with self._lock:
+            if model_info.id in self._active:
+                return DownloadResult(
+                    success=False,
+                    model_id=model_info.id,
+                    error="This model is already being downloaded",
+                )
+            self._active[model_info.id] = cancel
 
         logger.info(
             "Starting download: %s (%dMB) from %s",
@@ -188,131 +462,79 @@ class ModelDownloader:
         temp_path = target_path.with_suffix(".tmp")
 
         try:
-            # Get the download URL from HuggingFace
-            url = hf_hub_url(
-                repo_id=model_info.repo_id,
-                filename=model_info.filename,
-            )
-
-            # Get headers (for authentication if needed)
-            headers = build_hf_headers()
-
-            # Start download with streaming
-            # Use tuple timeout: (connect_timeout, read_timeout)
-            # Read timeout is per-chunk, not total, so 60s is plenty
-            response = requests.get(
-                url, headers=headers, stream=True, timeout=(30, 60), allow_redirects=True
-            )
-            response.raise_for_status()
-
-            # Get total size from headers
-            total_size = int(response.headers.get("content-length", 0))
-            if total_size == 0:
-                total_size = model_info.size_mb * 1024 * 1024  # Fallback to catalog size
-
-            # Track progress
-            downloaded = 0
-            start_time = time.time()
-            last_update_time = start_time
-            last_bytes = 0
-            smoothed_speed = 0.0
-            chunk_size = 1024 * 1024  # 1MB chunks for faster downloads
-
-            logger.info(
-                "Download starting: %s (%.1f MB)", model_info.name, total_size / (1024 * 1024)
-            )
-
-            # Initial progress callback
-            if progress_callback:
-                progress_callback(
-                    DownloadProgress(
-                        model_id=model_info.id,
-                        downloaded_bytes=0,
-                        total_bytes=total_size,
-                        speed_bps=0,
-                    )
+            hf = _get_hf()
+            hasher = None
+            # Set when this process wrote the file's pages itself
+            wrote_pages = False
+
+            # A copy already in the Hugging Face cache is linked, not fetched
+            downloaded = self._link_from_hf_cache(hf, model_info, temp_path)
+            total_size = downloaded
+            if not downloaded:
+                # Get the download URL from HuggingFace
+                url = hf["hf_hub_url"](
+                    repo_id=model_info.repo_id,
+                    filename=model_info.filename,
                 )
 
-            with open(temp_path, "wb") as f:
-                for chunk in response.iter_content(chunk_size=chunk_size):
-                    # Check for cancellation
-                    if self._cancel_requested:
-                        raise DownloadCancelledException("Download cancelled by user")
+                # Get headers (for authentication if needed)
+                headers = hf["build_hf_headers"]()
+
+                if use_hf_transfer is None:
+                    use_hf_transfer = _hf_transfer_available()
+                if use_hf_transfer:
+                    fetch = self._transfer_download
+                elif model_info.size_mb * 1024 * 1024 >= _RANGE_MIN_SIZE:
+                    fetch = self._range_download
+                    wrote_pages = True
+                else:
+                    fetch = self._stream_download
+                    wrote_pages = True
+                    if model_info.sha256:
+                        # Hash chunks as they stream so the file is read only once
+                        hasher = hashlib.sha256()
+                        fetch = functools.partial(self._stream_download, hasher=hasher)
+                downloaded, total_size = fetch(
+                    url, headers, temp_path, model_info, cancel, progress_callback
+                )
 
-                    if chunk:
-                        f.write(chunk)
-                        downloaded += len(chunk)
-
-                        # Update progress every 250ms
-                        current_time = time.time()
-                        elapsed = current_time - last_update_time
-
-                        if elapsed >= 0.25 and progress_callback:
-                            bytes_delta = downloaded - last_bytes
-                            instant_speed = bytes_delta / elapsed if elapsed > 0 else 0
-
-                            # Smooth speed with EMA
-                            if smoothed_speed == 0:
-                                smoothed_speed = instant_speed
-                            else:
-                                smoothed_speed = 0.3 * instant_speed + 0.7 * smoothed_speed
-
-                            last_update_time = current_time
-                            last_bytes = downloaded
-
-                            progress_callback(
-                                DownloadProgress(
-                                    model_id=model_info.id,
-                                    downloaded_bytes=downloaded,
-                                    total_bytes=total_size,
-                                    speed_bps=smoothed_speed,
-                                )
-                            )
-
-            # Verify download completed
-            if not temp_path.exists():
-                raise RuntimeError(f"Download failed: temp file not created at {temp_path}")
-
-            actual_size = temp_path.stat().st_size
-            if actual_size == 0:
-                temp_path.unlink()
+            # Verify download completed; the byte counter already holds the file size.
+            # Failures raise into the handler below, which removes the temp file.
+            if downloaded == 0:
                 raise RuntimeError("Download failed: file is empty")
 
-            if total_size > 0 and actual_size < total_size * 0.99:  # Allow 1% tolerance
-                temp_path.unlink()
+            if total_size > 0 and downloaded < total_size * 0.99:  # Allow 1% tolerance
                 raise RuntimeError(
-                    f"Download incomplete: got {actual_size} bytes, expected {total_size}"
+                    f"Download incomplete: got {downloaded} bytes, expected {total_size}"
                 )
 
             # Validate checksum if available
             if model_info.sha256:
-                import hashlib
-
-                h = hashlib.sha256()
-                with open(temp_path, "rb") as fh:
-                    for chunk in iter(lambda: fh.read(1024 * 1024), b""):
-                        h.update(chunk)
-                actual_hash = h.hexdigest()
+                actual_hash = hasher.hexdigest() if hasher else _file_sha256(temp_path)
                 if actual_hash != model_info.sha256:
-                    temp_path.unlink()
                     raise RuntimeError(
                         f"Checksum mismatch: expected {model_info.sha256[:16]}..., "
                         f"got {actual_hash[:16]}..."
                     )
                 logger.debug("Checksum validated for %s", model_info.name)
 
-            # Rename temp file to final path
-            if target_path.exists():
-                target_path.unlink()
-            temp_path.rename(target_path)
+            # Nothing reads a multi-GB model back soon; let the kernel drop the
+            # pages we wrote instead of evicting other applications' cache
+            if _HAS_FADVISE and wrote_pages:
+                _drop_page_cache(temp_path)
+
+            # The temp file sits beside the target, so this is a same-device
+            # atomic rename that also overwrites any existing file
+            os.replace(temp_path, target_path)
+            self._disk_cache = None
 
             # Final progress update
             if progress_callback:
                 progress_callback(
                     DownloadProgress(
                         model_id=model_info.id,
-                        downloaded_bytes=total_size,
-                        total_bytes=total_size,
+                        downloaded_bytes=downloaded,
+                        total_bytes=downloaded,
                         speed_bps=0,
                     )
                 )
@@ -328,13 +550,11 @@ class ModelDownloader:
         except DownloadCancelledException:
             logger.info("Download cancelled: %s", model_info.name)
             # Clean up temp file
-            if temp_path.exists():
-                temp_path.unlink()
-            return DownloadResult(success=False, model_id=model_info.id, error="Download cancelled")
+            temp_path.unlink(missing_ok=True)
+            return DownloadResult(success=False, model_id=model_info.id, error=_CANCELLED_ERROR)
         except requests.exceptions.HTTPError as e:
             logger.error("HTTP error downloading %s: %s", model_info.name, e)
-            if temp_path.exists():
-                temp_path.unlink()
+            temp_path.unlink(missing_ok=True)
             status_code = e.response.status_code if e.response else 0
             if status_code == 401:
                 error_msg = "Authentication required. This model may need a HuggingFace account."
@@ -349,8 +569,7 @@ class ModelDownloader:
             return DownloadResult(success=False, model_id=model_info.id, error=error_msg)
         except requests.exceptions.ConnectionError:
             logger.error("Connection error downloading %s", model_info.name)
-            if temp_path.exists():
-                temp_path.unlink()
+            temp_path.unlink(missing_ok=True)
             return DownloadResult(
                 success=False,
                 model_id=model_info.id,
@@ -358,25 +577,332 @@ class ModelDownloader:
             )
         except requests.exceptions.Timeout:
             logger.error("Timeout downloading %s", model_info.name)
-            if temp_path.exists():
-                temp_path.unlink()
+            temp_path.unlink(missing_ok=True)
             return DownloadResult(
                 success=False, model_id=model_info.id, error="Download timed out. Try again later."
             )
         except Exception as e:
             logger.error("Download failed for %s: %s", model_info.name, e, exc_info=True)
-            if temp_path.exists():
-                temp_path.unlink()
+            temp_path.unlink(missing_ok=True)
             return DownloadResult(success=False, model_id=model_info.id, error=str(e))
         finally:
-            self._current_download = None
+            with self._lock:
+                del self._active[model_info.id]
+
+    def _link_from_hf_cache(
+        self, hf: dict[str, Any], model_info: ModelInfo, temp_path: Path
+    ) -> int:
+        """Hard-link a file that huggingface_hub has already cached.
+
+        Costs no network or disk IO, and unlike a symlink the model survives
+        the cache being cleaned later.
+
+        Returns:
+            Size of the linked file in bytes, or 0 if nothing was linked
+        """
+        cached = hf["try_to_load_from_cache"](
+            repo_id=model_info.repo_id, filename=model_info.filename
+        )
+        if not isinstance(cached, str):
+            return 0
+        try:
+            temp_path.unlink(missing_ok=True)
+            os.link(os.path.realpath(cached), temp_path)
+        except OSError as e:
+            # e.g. cache on another filesystem; fall back to downloading
+            logger.debug("Could not link %s from HF cache: %s", model_info.name, e)
+            return 0
+        logger.info("Linked %s from the Hugging Face cache", model_info.name)
+        return os.stat(temp_path).st_size
+
+    def _stream_download(
+        self,
+        url: str,
+        headers: dict[str, str],
+        temp_path: Path,
+        model_info: ModelInfo,
+        cancel: threading.Event,
+        progress_callback: Callable[[DownloadProgress], None] | None,
+        hasher: Any = None,
+    ) -> tuple[int, int]:
+        """Stream a file over a single connection.
+
+        If a hashlib object is given, every chunk is fed to it as it is written.
+
+        Returns:
+            (bytes written, expected total bytes)
+        """
+        # Use tuple timeout: (connect_timeout, read_timeout)
+        # Read timeout is per-chunk, not total, so 60s is plenty
+        response = self._get_session().get(
+            url, headers=headers, stream=True, timeout=(30, 60), allow_redirects=True
+        )
+        response.raise_for_status()
+
+        total_size = _expected_size(response.headers, model_info)
+        logger.info("Download starting: %s (%.1f MB)", model_info.name, total_size / (1024 * 1024))
+
+        reporter = _ProgressReporter(model_info.id, total_size, progress_callback)
+        chunk_size = 1024 * 1024  # 1MB chunks for faster downloads
+
+        with open(temp_path, "wb") as f:
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                # Check for cancellation
+                if cancel.is_set():
+                    raise DownloadCancelledException("Download cancelled by user")
+
+                if chunk:
+                    f.write(chunk)
+                    if hasher is not None:
+                        hasher.update(chunk)
+                    reporter.advance(len(chunk))
+
+        return reporter.downloaded, total_size
+
+    def _range_download(
+        self,
+        url: str,
+        headers: dict[str, str],
+        temp_path: Path,
+        model_info: ModelInfo,
+        cancel: threading.Event,
+        progress_callback: Callable[[DownloadProgress], None] | None,
+    ) -> tuple[int, int]:
+        """Download a large file as parallel HTTP Range slices.
+
+        Each slice is written in place with os.pwrite into a preallocated
+        file. Falls back to a single stream if the server cannot serve ranges.
+
+        Returns:
+            (bytes written, expected total bytes)
+        """
+        head = self._get_session().head(
+            url, headers=headers, timeout=(30, 60), allow_redirects=True
+        )
+        head.raise_for_status()
+
+        total_size = int(head.headers.get("content-length", 0))
+        if total_size < _RANGE_MIN_SIZE or head.headers.get("accept-ranges") != "bytes":
+            return self._stream_download(
+                url, headers, temp_path, model_info, cancel, progress_callback
+            )
+
+        resolved = head.url
+        headers = _redirect_headers(headers, url, resolved)
+
+        logger.info(
+            "Download starting (%d connections): %s (%.1f MB)",
+            _RANGE_CONNECTIONS,
+            model_info.name,
+            total_size / (1024 * 1024),
+        )
+
+        reporter = _ProgressReporter(model_info.id, total_size, progress_callback)
+        failed = threading.Event()
+        slice_size = -(-total_size // _RANGE_CONNECTIONS)
+
+        def fetch_slice(start: int, end: int) -> None:
+            # Each slice worker uses its own thread's Session; closing the
+            # response on every exit returns its connection to that pool
+            with self._get_session().get(
+                resolved,
+                headers={**headers, "Range": f"bytes={start}-{end}"},
+                stream=True,
+                timeout=(30, 60),
+            ) as response:
+                response.raise_for_status()
+                if response.status_code != 206:
+                    raise RuntimeError("Server ignored the Range request")
+
+                offset = start
+                for chunk in response.iter_content(chunk_size=1024 * 1024):
+                    if cancel.is_set():
+                        raise DownloadCancelledException("Download cancelled by user")
+                    if failed.is_set():
+                        return
+                    os.pwrite(fd, chunk, offset)
+                    offset += len(chunk)
+                    reporter.advance(len(chunk))
+
+            if offset != end + 1:
+                raise RuntimeError(f"Range {start}-{end} ended early at byte {offset}")
+
+        fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            try:
+                os.posix_fallocate(fd, 0, total_size)
+            except (AttributeError, OSError):
+                # Not supported on this platform/filesystem; a sparse file works too
+                os.ftruncate(fd, total_size)
+
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=_RANGE_CONNECTIONS, thread_name_prefix="dl-range"
+            ) as executor:
+                futures = [
+                    executor.submit(fetch_slice, start, min(start + slice_size, total_size) - 1)
+                    for start in range(0, total_size, slice_size)
+                ]
+                error: BaseException | None = None
+                for future in concurrent.futures.as_completed(futures):
+                    exc = future.exception()
+                    if exc is not None and error is None:
+                        # Stop the other slices, then report the first failure
+                        error = exc
+                        failed.set()
+                if error is not None:
+                    raise error
+        finally:
+            os.close(fd)
+
+        return reporter.downloaded, total_size
+
+    def _transfer_download(
+        self,
+        url: str,
+        headers: dict[str, str],
+        temp_path: Path,
+        model_info: ModelInfo,
+        cancel: threading.Event,
+        progress_callback: Callable[[DownloadProgress], None] | None,
+    ) -> tuple[int, int]:
+        """Download a file with hf_transfer's parallel Rust downloader.
+
+        Returns:
+            (bytes written, expected total bytes)
+        """
+        import hf_transfer
+
+        # Resolve the CDN redirect and size up front; hf_transfer needs both
+        head = self._get_session().head(
+            url, headers=headers, timeout=(30, 60), allow_redirects=True
+        )
+        head.raise_for_status()
+
+        total_size = _expected_size(head.headers, model_info)
+        logger.info(
+            "Download starting (hf_transfer): %s (%.1f MB)",
+            model_info.name,
+            total_size / (1024 * 1024),
+        )
+
+        reporter = _ProgressReporter(model_info.id, total_size, progress_callback)
+
+        def on_chunk(nbytes: int) -> None:
+            # Raising here aborts the transfer from inside hf_transfer
+            if cancel.is_set():
+                raise DownloadCancelledException("Download cancelled by user")
+            reporter.advance(nbytes)
+
+        try:
+            hf_transfer.download(
+                url=head.url,
+                filename=os.fspath(temp_path),
+                max_files=_HF_TRANSFER_MAX_FILES,
+                chunk_size=_HF_TRANSFER_CHUNK_SIZE,
+                headers=_redirect_headers(headers, url, head.url),
+                parallel_failures=3,
+                max_retries=5,
+                callback=on_chunk,
+            )
+        except Exception:
+            # hf_transfer re-wraps callback errors, so check the token directly
+            if cancel.is_set():
+                raise DownloadCancelledException("Download cancelled by user") from None
+            raise
+
+        return reporter.downloaded, total_size
+
+    def download_many(
+        self,
+        model_infos: list[ModelInfo],
+        progress_callback: Callable[[DownloadProgress], None] | None = None,
+        max_workers: int | None = None,
+    ) -> list[DownloadResult]:
+        """Download several models concurrently.
+
+        Args:
+            model_infos: The models to download
+            progress_callback: Called with progress updates from every worker;
+                use DownloadProgress.model_id to tell the files apart
+            max_workers: Concurrent downloads (default: $HF_PARALLEL_DOWNLOADING_WORKERS or 8)
+
+        Returns:
+            One DownloadResult per model, in the same order as model_infos
+        """
+        if not model_infos:
+            return []
+        workers = min(max_workers or _parallel_workers(), len(model_infos))
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="dl-many"
+        ) as executor:
+            futures = [
+                executor.submit(self._run_with_callback, info, progress_callback, None)
+                for info in model_infos
+            ]
+            return [future.result() for future in futures]
+
+    def download_queue(
+        self,
+        model_infos: list[ModelInfo],
+        progress_callback: Callable[[DownloadProgress], None] | None = None,
+        max_workers: int = 2,
+    ) -> list[DownloadResult]:
+        """Download models in order, overlapping each with the next.
+
+        The next download starts once the running one is 75% done, so its
+        connection setup and TCP slow start overlap the previous file's tail
+        instead of following it. Cancelling stops the rest of the queue.
+
+        Args:
+            model_infos: The models to download, in order
+            progress_callback: Called with progress updates for every model
+            max_workers: Maximum downloads in flight at once
+
+        Returns:
+            One DownloadResult per model, in the same order as model_infos
+        """
+        stopped = threading.Event()
+        futures: list[concurrent.futures.Future[DownloadResult]] = []
+
+        def start(info: ModelInfo, gate: threading.Event):
+            def on_progress(progress: DownloadProgress):
+                if progress.progress >= _PIPELINE_THRESHOLD:
+                    gate.set()
+                if progress_callback:
+                    progress_callback(progress)
+
+            def on_complete(result: DownloadResult):
+                if result.error == _CANCELLED_ERROR:
+                    stopped.set()
+                gate.set()
+
+            return executor.submit(self._run_with_callback, info, on_progress, on_complete)
+
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="dl-queue"
+        ) as executor:
+            gate = threading.Event()
+            for info in model_infos:
+                if futures:
+                    gate.wait()
+                    gate = threading.Event()
+                if stopped.is_set():
+                    break
+                futures.append(start(info, gate))
+
+        results = [future.result() for future in futures]
+        results.extend(
+            DownloadResult(success=False, model_id=info.id, error=_CANCELLED_ERROR)
+            for info in model_infos[len(results) :]
+        )
+        return results
 
     def download_async(
         self,
         model_info: ModelInfo,
         progress_callback: Callable[[DownloadProgress], None] | None = None,
         complete_callback: Callable[[DownloadResult], None] | None = None,
-    ) -> threading.Thread:
+    ) -> concurrent.futures.Future[DownloadResult]:
         """Download a model asynchronously.
 
         Args:
@@ -385,39 +911,91 @@ class ModelDownloader:
             complete_callback: Called when download completes (from download thread)
 
         Returns:
-            The download thread
+            A Future resolving to the DownloadResult
+        """
+        return self._executor.submit(
+            self._run_with_callback, model_info, progress_callback, complete_callback
+        )
+
+    async def download_aio(
+        self,
+        model_info: ModelInfo,
+        progress_callback: Callable[[DownloadProgress], None] | None = None,
+    ) -> DownloadResult:
+        """Download a model from a running asyncio event loop.
+
+        The blocking download runs on the loop's default executor rather than
+        the single download worker, so several calls can be awaited together
+        with asyncio.gather(). Progress callbacks still fire on that thread.
+
+        Args:
+            model_info: The model to download
+            progress_callback: Called with progress updates (from executor thread)
+
+        Returns:
+            DownloadResult with success status and path or error
         """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, self._run_with_callback, model_info, progress_callback, None
+        )
 
-        def run():
+    def _run_with_callback(
+        self,
+        model_info: ModelInfo,
+        progress_callback: Callable[[DownloadProgress], None] | None,
+        complete_callback: Callable[[DownloadResult], None] | None,
+    ) -> DownloadResult:
+        """Run a download on the worker thread and report the result."""
+        try:
+            result = self.download(model_info, progress_callback)
+        except Exception as e:
+            logger.error("Download thread failed: %s", e, exc_info=True)
+            result = DownloadResult(
+                success=False,
+                model_id=model_info.id,
+                error=str(e),
+            )
+        if complete_callback:
             try:
-                result = self.download(model_info, progress_callback)
+                complete_callback(result)
             except Exception as e:
-                logger.error("Download thread failed: %s", e, exc_info=True)
-                result = DownloadResult(
-                    success=False,
-                    model_id=model_info.id,
-                    error=str(e),
-                )
-            if complete_callback:
-                try:
-                    complete_callback(result)
-                except Exception as e:
-                    logger.error("Download complete callback error: %s", e, exc_info=True)
+                logger.error("Download complete callback error: %s", e, exc_info=True)
+        return result
+
+    def cancel_download(self, model_id: str | None = None):
+        """Request cancellation of one download, or of all of them if no ID is given."""
+        with self._lock:
+            if model_id is None:
+                tokens = list(self._active.values())
+            else:
+                tokens = [self._active[model_id]] if model_id in self._active else []
+        for token in tokens:
+            token.set()
 
-        thread = threading.Thread(target=run, daemon=True)
-        thread.start()
-        return thread
+    def shutdown(self):
+        """Cancel any running download and stop the worker thread.
 
-    def cancel_download(self):
-        """Request cancellation of current download."""
-        self._cancel_requested = True
+        Pool threads are not daemons, so this must be called before exit
+        to keep an in-flight download from blocking interpreter shutdown.
+        """
+        self.cancel_download()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        with self._lock:
+            sessions = list(self._sessions)
+        for session in sessions:
+            session.close()
 
     @property
     def is_downloading(self) -> bool:
         """Check if a download is in progress."""
-        return self._current_download is not None
+        return bool(self._active)
 
     @property
     def current_download_id(self) -> str | None:
-        """Get the ID of the model currently being downloaded."""
-        return self._current_download
+        """Get the ID of the model currently being downloaded.
+
+        With several downloads in flight this is the earliest one started.
+        """
+        with self._lock:
+            return next(iter(self._active), None)
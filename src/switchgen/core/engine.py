@@ -395,20 +395,22 @@ class GenerationEngine:
             self._memory_manager.interrupt_current_processing()
 
 
-def tensor_to_pil(tensor: Any) -> list:
-    """Convert ComfyUI image tensor to PIL Images.
+def tensor_to_uint8(tensor: Any) -> Any:
+    """Convert a ComfyUI image tensor to 8-bit pixels.
+
+    The whole batch is scaled in one vectorised pass, so callers that only
+    need raw pixels (e.g. for a GPU texture upload) can skip PIL entirely.
 
     Args:
         tensor: PyTorch tensor (Batch, Height, Width, Channels) in [0, 1] range
 
     Returns:
-        List of PIL Image objects
+        Contiguous uint8 numpy array (Batch, Height, Width, Channels), or None
     """
     import numpy as np
-    from PIL import Image
 
     if tensor is None:
-        return []
+        return None
 
     # Ensure tensor is on CPU and convert to numpy
     if hasattr(tensor, "cpu"):
@@ -417,12 +419,24 @@ def tensor_to_pil(tensor: Any) -> list:
         tensor = tensor.numpy()
 
     # ComfyUI format: (B, H, W, C) with values in [0, 1]
-    images = []
-    for i in range(tensor.shape[0]):
-        img_array = (tensor[i] * 255).astype(np.uint8)
-        images.append(Image.fromarray(img_array))
+    return np.ascontiguousarray((np.asarray(tensor) * 255).astype(np.uint8))
+
+
+def tensor_to_pil(tensor: Any) -> list:
+    """Convert ComfyUI image tensor to PIL Images.
 
-    return images
+    Args:
+        tensor: PyTorch tensor (Batch, Height, Width, Channels) in [0, 1] range
+
+    Returns:
+        List of PIL Image objects
+    """
+    from PIL import Image
+
+    pixels = tensor_to_uint8(tensor)
+    if pixels is None:
+        return []
+    return [Image.fromarray(img_array) for img_array in pixels]
 
 
 # Global engine instance
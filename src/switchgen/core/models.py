@@ -1,8 +1,11 @@
 """Model catalog and registry for downloadable models."""
 
+import functools
+import os
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
+from typing import Any
 
 
 class ModelType(Enum):
@@ -25,9 +28,13 @@ class QualityTier(Enum):
     HIGH = "high"  # Best quality, higher requirements
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ModelInfo:
-    """Information about a downloadable model."""
+    """Information about a downloadable model.
+
+    Catalog entries are immutable and hashable; use dataclasses.replace()
+    to derive a modified copy.
+    """
 
     id: str
     name: str
@@ -37,17 +44,31 @@ class ModelInfo:
     size_mb: int  # Approximate size in MB
     description: str  # Short description
     local_filename: str | None = None  # Override local filename (default: same as filename)
-    required_for: list[str] = field(default_factory=list)  # Workflow types that need it
+    required_for: frozenset[str] = frozenset()  # Workflow types that need it
     # Beginner-friendly fields
     vram_gb: float = 4.0  # Minimum VRAM required in GB
     quality_tier: QualityTier = QualityTier.STANDARD
     recommended: bool = False  # Show as recommended for beginners
     tips: str = ""  # Usage tips for beginners
     sha256: str | None = None  # Expected SHA256 hash for download validation
+    # Resolved local filename, computed once since the catalog is scanned on every refresh
+    _local_filename: str = field(init=False, repr=False, compare=False)
+    # Display strings for the download dialog, formatted once per entry
+    size_label: str = field(init=False, repr=False, compare=False)
+    vram_label: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_local_filename", self.local_filename or self.filename)
+        object.__setattr__(
+            self,
+            "size_label",
+            f"{self.size_mb / 1024:.1f} GB" if self.size_mb >= 1024 else f"{self.size_mb} MB",
+        )
+        object.__setattr__(self, "vram_label", f"{self.vram_gb:.0f}GB VRAM")
 
     def get_local_filename(self) -> str:
         """Get the filename to use locally."""
-        return self.local_filename or self.filename
+        return self._local_filename
 
 
 # Curated catalog of recommended models
@@ -64,7 +85,7 @@ MODEL_CATALOG: dict[str, ModelInfo] = {
         local_filename="clip_vit_l.safetensors",
         size_mb=890,
         description="Required for 3D view generation",
-        required_for=["3d"],
+        required_for=frozenset({"3d"}),
         vram_gb=2.0,
         quality_tier=QualityTier.STANDARD,
         tips="This is automatically used by the 3D workflow. Download it along with Stable Zero123.",
@@ -81,7 +102,7 @@ MODEL_CATALOG: dict[str, ModelInfo] = {
         local_filename="t5-base.safetensors",
         size_mb=850,
         description="Required for audio generation",
-        required_for=["audio"],
+        required_for=frozenset({"audio"}),
         vram_gb=2.0,
         quality_tier=QualityTier.STANDARD,
         tips="This is automatically used by the Audio workflow. Download it along with Stable Audio.",
@@ -97,7 +118,7 @@ MODEL_CATALOG: dict[str, ModelInfo] = {
         filename="v1-5-pruned-emaonly.safetensors",
         size_mb=4270,
         description="Best for beginners - fast, low VRAM, great results",
-        required_for=["text2img", "img2img"],
+        required_for=frozenset({"text2img", "img2img"}),
         vram_gb=4.0,
         quality_tier=QualityTier.STARTER,
         recommended=True,
@@ -111,7 +132,7 @@ MODEL_CATALOG: dict[str, ModelInfo] = {
         filename="sd-v1-5-inpainting.ckpt",
         size_mb=4270,
         description="Edit parts of images - remove or replace objects",
-        required_for=["inpaint"],
+        required_for=frozenset({"inpaint"}),
         vram_gb=4.0,
         quality_tier=QualityTier.STARTER,
         tips="Use with the Inpainting workflow. Paint white over areas you want to change, then describe what should appear there.",
@@ -127,7 +148,7 @@ MODEL_CATALOG: dict[str, ModelInfo] = {
         filename="sd_xl_base_1.0.safetensors",
         size_mb=6940,
         description="Higher quality images, better text and faces",
-        required_for=["text2img"],
+        required_for=frozenset({"text2img"}),
         vram_gb=8.0,
         quality_tier=QualityTier.HIGH,
         tips="Produces stunning 1024x1024 images. Needs 8GB+ VRAM. Better at understanding complex prompts and rendering text in images.",
@@ -155,7 +176,7 @@ MODEL_CATALOG: dict[str, ModelInfo] = {
         filename="stable_zero123.ckpt",
         size_mb=4900,
         description="Create 3D views of objects from a single photo",
-        required_for=["3d"],
+        required_for=frozenset({"3d"}),
         vram_gb=6.0,
         quality_tier=QualityTier.STANDARD,
         tips="Upload a photo of an object (ideally on a plain background) and rotate the camera around it. Also requires CLIP ViT-L model.",
@@ -172,7 +193,7 @@ MODEL_CATALOG: dict[str, ModelInfo] = {
         local_filename="stable-audio-open-1.0.safetensors",
         size_mb=4850,
         description="Generate music and sound effects from text",
-        required_for=["audio"],
+        required_for=frozenset({"audio"}),
         vram_gb=6.0,
         quality_tier=QualityTier.STANDARD,
         tips="Describe sounds like 'upbeat electronic music' or 'rain on a window'. Also requires the T5 Base text encoder.",
@@ -265,19 +286,69 @@ MODEL_CATALOG: dict[str, ModelInfo] = {
 }
 
 
-def get_models_by_type(model_type: ModelType) -> list[ModelInfo]:
+def _build_indexes() -> tuple[
+    dict[ModelType, tuple[ModelInfo, ...]], dict[str, tuple[ModelInfo, ...]]
+]:
+    """Group the catalog by type and by required workflow in a single pass."""
+    by_type: dict[ModelType, list[ModelInfo]] = {}
+    by_workflow: dict[str, list[ModelInfo]] = {}
+    for model in MODEL_CATALOG.values():
+        by_type.setdefault(model.type, []).append(model)
+        for workflow in model.required_for:
+            by_workflow.setdefault(workflow, []).append(model)
+    return (
+        {key: tuple(models) for key, models in by_type.items()},
+        {key: tuple(models) for key, models in by_workflow.items()},
+    )
+
+
+# Reverse indexes, built once at import. MODEL_CATALOG is fixed, so the
+# catalog queries below are dict lookups returning tuples callers cannot mutate.
+_BY_TYPE, _BY_WORKFLOW = _build_indexes()
+_RECOMMENDED: tuple[ModelInfo, ...] = tuple(m for m in MODEL_CATALOG.values() if m.recommended)
+
+
+# Position of each ModelType, used as its id in the catalog arrays below
+_TYPE_INDEX: dict[ModelType, int] = {t: i for i, t in enumerate(ModelType)}
+
+
+@functools.cache
+def _catalog_arrays() -> tuple[Any, Any]:
+    """Column arrays of the catalog for vectorised queries.
+
+    numpy is imported on first use rather than at module import, since the
+    catalog is loaded at startup and most sessions never aggregate over it.
+
+    Returns:
+        (size_mb, type_id) arrays, in MODEL_CATALOG order
+    """
+    import numpy as np
+
+    models = MODEL_CATALOG.values()
+    sizes = np.fromiter((m.size_mb for m in models), dtype=np.int64, count=len(models))
+    type_ids = np.fromiter((_TYPE_INDEX[m.type] for m in models), dtype=np.int8, count=len(models))
+    return sizes, type_ids
+
+
+def total_size_by_type(model_type: ModelType) -> int:
+    """Get the combined download size in MB of all models of a type."""
+    sizes, type_ids = _catalog_arrays()
+    return int(sizes[type_ids == _TYPE_INDEX[model_type]].sum())
+
+
+def get_models_by_type(model_type: ModelType) -> tuple[ModelInfo, ...]:
     """Get all models of a specific type."""
-    return [m for m in MODEL_CATALOG.values() if m.type == model_type]
+    return _BY_TYPE.get(model_type, ())
 
 
-def get_recommended_models() -> list[ModelInfo]:
+def get_recommended_models() -> tuple[ModelInfo, ...]:
     """Get models marked as recommended for beginners."""
-    return [m for m in MODEL_CATALOG.values() if m.recommended]
+    return _RECOMMENDED
 
 
-def get_required_models(workflow_type: str) -> list[ModelInfo]:
+def get_required_models(workflow_type: str) -> tuple[ModelInfo, ...]:
     """Get models required for a specific workflow type."""
-    return [m for m in MODEL_CATALOG.values() if workflow_type in m.required_for]
+    return _BY_WORKFLOW.get(workflow_type, ())
 
 
 def get_model_info(model_id: str) -> ModelInfo | None:
@@ -290,3 +361,20 @@ def is_model_installed(model_info: ModelInfo, models_dir: Path) -> bool:
     target_dir = models_dir / model_info.type.value
     target_file = target_dir / model_info.get_local_filename()
     return target_file.exists()
+
+
+def installed_set(models_dir: Path) -> set[str]:
+    """Get the IDs of all installed catalog models.
+
+    Reads each model-type subdirectory once and tests catalog filenames
+    against the listing, instead of a stat() per catalog entry.
+    """
+    installed: set[str] = set()
+    for model_type, models in _BY_TYPE.items():
+        try:
+            with os.scandir(os.path.join(models_dir, model_type.value)) as it:
+                names = {e.name for e in it if e.is_file()}
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+        installed.update(m.id for m in models if m.get_local_filename() in names)
+    return installed
@@ -5,8 +5,8 @@ handles ComfyUI initialization, generation orchestration, VRAM monitoring,
 keyboard shortcuts, and session persistence.
 """
 
-import io
 import threading
+from collections.abc import Callable
 
 from ..core.logging import get_logger
 
@@ -17,7 +17,7 @@ try:
 
     gi.require_version("Gtk", "4.0")
     gi.require_version("Adw", "1")
-    from gi.repository import Adw, GdkPixbuf, GLib, Gtk
+    from gi.repository import Adw, Gdk, Gio, GLib, Gtk
 except (ImportError, ValueError):
     pass
 
@@ -31,13 +31,100 @@ from ..core import (
     build_inpaint_workflow,
     build_text2img_memory_workflow,
     get_available_checkpoints,
-    tensor_to_pil,
+    tensor_to_uint8,
 )
 from ..core.config import get_config
 from ..core.queue import GenerationJob, get_queue
 from .model_dialog import ModelDownloadDialog
 from .widgets import BottomBar, ControlPanel, PreviewPanel
 
+# Workflow builder per type, with a function mapping (params, prompt, negative)
+# to the builder's workflow-specific keyword arguments
+_WORKFLOW_BUILDERS: dict[WorkflowType, tuple[Callable, Callable[[dict, str, str], dict]]] = {
+    WorkflowType.TEXT2IMG: (
+        build_text2img_memory_workflow,
+        lambda params, prompt, negative: {
+            "prompt": prompt,
+            "negative_prompt": negative,
+            "width": params["width"],
+            "height": params["height"],
+            "capture_id": "default",
+        },
+    ),
+    WorkflowType.IMG2IMG: (
+        build_img2img_memory_workflow,
+        lambda params, prompt, negative: {
+            "image_path": params["input_image_path"],
+            "prompt": prompt,
+            "negative_prompt": negative,
+            "denoise": params["denoise"],
+            "capture_id": "default",
+        },
+    ),
+    WorkflowType.INPAINT: (
+        build_inpaint_workflow,
+        lambda params, prompt, negative: {
+            "image_path": params["input_image_path"],
+            "mask_path": params["mask_image_path"],
+            "prompt": prompt,
+            "negative_prompt": negative,
+            "denoise": params["denoise"],
+            "capture_id": "default",
+        },
+    ),
+    WorkflowType.AUDIO: (
+        build_audio_workflow,
+        lambda params, prompt, negative: {
+            "prompt": prompt,
+            "negative_prompt": negative,
+            "seconds": params["duration"],
+        },
+    ),
+    WorkflowType.THREE_D: (
+        build_3d_zero123_workflow,
+        lambda params, prompt, negative: {
+            "image_path": params["input_image_path"],
+            "elevation": params["elevation"],
+            "azimuth": params["azimuth"],
+            "capture_id": "default",
+        },
+    ),
+}
+
+# VRAM poll interval in seconds while generating and while idle
+_VRAM_POLL_BUSY_S = 1
+_VRAM_POLL_IDLE_S = 5
+
+# Longest preview edge uploaded to the GPU; larger generations are shrunk first
+_PREVIEW_MAX_EDGE = 2048
+
+# Raw 8-bit pixels: (data, width, height, channels), channels being 3 (RGB) or 4 (RGBA)
+_Pixels = tuple[bytes, int, int, int]
+
+
+def _array_pixels(array) -> _Pixels:
+    """Get the raw bytes and geometry of an (H, W, C) uint8 array."""
+    height, width, channels = array.shape
+    return array.tobytes(), width, height, channels
+
+
+def _image_pixels(pil_image) -> _Pixels:
+    """Get the raw bytes and geometry of an RGB or RGBA PIL image."""
+    return pil_image.tobytes(), pil_image.width, pil_image.height, len(pil_image.getbands())
+
+
+def _pixels_to_texture(pixels: _Pixels) -> "Gdk.Texture":
+    """Build a Gdk.MemoryTexture from raw pixel bytes.
+
+    GLib.Bytes.new copies the buffer once into GLib memory; PyGObject has no
+    zero-copy path from a Python bytes object (new_take copies as well).
+    """
+    data, width, height, channels = pixels
+    memory_format = Gdk.MemoryFormat.R8G8B8A8 if channels == 4 else Gdk.MemoryFormat.R8G8B8
+    return Gdk.MemoryTexture.new(
+        width, height, memory_format, GLib.Bytes.new(data), width * channels
+    )
+
 
 class MainWindow(Adw.ApplicationWindow):
     """Main SwitchGen window.
@@ -59,7 +146,19 @@ class MainWindow(Adw.ApplicationWindow):
         # State
         self._generating = False
         self._queue = None
+        # Checkpoint list, or error message, from the background ComfyUI init
+        self._init_result: list[str] | str = []
         self._current_seed: int | None = None
+        # Last VRAM reading shown, in tenths of a GB (the label's resolution)
+        self._last_vram_tenths: tuple[int, int] | None = None
+        # Engine's VRAM reader, bound once ComfyUI is ready
+        self._get_vram: Callable[[], tuple[int, int]] | None = None
+        # Pending VRAM poll timer, 0 when none is armed
+        self._vram_source = 0
+        # Latest sampler progress, drained by at most one pending idle callback
+        self._latest_progress: ProgressInfo | None = None
+        self._progress_scheduled = False
+        self._progress_lock = threading.Lock()
 
         # Build composite UI
         main_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
@@ -110,8 +209,9 @@ class MainWindow(Adw.ApplicationWindow):
         # Initialize ComfyUI in the background
         self.bottom_bar.set_generate_sensitive(False)
         self.bottom_bar.set_generate_label("Initializing...")
-        threading.Thread(target=self._init_comfy, daemon=True).start()
-        GLib.timeout_add(1000, self._update_vram)
+        Gio.Task.new(self, None, self._on_comfy_init_done, None).run_in_thread(self._init_comfy)
+        self._schedule_vram_poll()
+        self.connect("destroy", self._on_destroy)
 
     # =========================================================================
     # Keyboard shortcuts
@@ -219,63 +319,15 @@ class MainWindow(Adw.ApplicationWindow):
         workflow = None
         actual_seed = seed
 
-        if workflow_type == WorkflowType.TEXT2IMG:
-            workflow, actual_seed = build_text2img_memory_workflow(
-                checkpoint=checkpoint,
-                prompt=prompt,
-                negative_prompt=negative,
-                width=params["width"],
-                height=params["height"],
-                steps=steps,
-                cfg=cfg,
-                seed=seed,
-                capture_id="default",
-            )
-        elif workflow_type == WorkflowType.IMG2IMG:
-            workflow, actual_seed = build_img2img_memory_workflow(
-                checkpoint=checkpoint,
-                image_path=params["input_image_path"],
-                prompt=prompt,
-                negative_prompt=negative,
-                denoise=params["denoise"],
-                steps=steps,
-                cfg=cfg,
-                seed=seed,
-                capture_id="default",
-            )
-        elif workflow_type == WorkflowType.INPAINT:
-            workflow, actual_seed = build_inpaint_workflow(
-                checkpoint=checkpoint,
-                image_path=params["input_image_path"],
-                mask_path=params["mask_image_path"],
-                prompt=prompt,
-                negative_prompt=negative,
-                denoise=params["denoise"],
-                steps=steps,
-                cfg=cfg,
-                seed=seed,
-                capture_id="default",
-            )
-        elif workflow_type == WorkflowType.AUDIO:
-            workflow, actual_seed = build_audio_workflow(
-                checkpoint=checkpoint,
-                prompt=prompt,
-                negative_prompt=negative,
-                seconds=params["duration"],
-                steps=steps,
-                cfg=cfg,
-                seed=seed,
-            )
-        elif workflow_type == WorkflowType.THREE_D:
-            workflow, actual_seed = build_3d_zero123_workflow(
+        builder = _WORKFLOW_BUILDERS.get(workflow_type)
+        if builder:
+            build, extra_kwargs = builder
+            workflow, actual_seed = build(
                 checkpoint=checkpoint,
-                image_path=params["input_image_path"],
-                elevation=params["elevation"],
-                azimuth=params["azimuth"],
                 steps=steps,
                 cfg=cfg,
                 seed=seed,
-                capture_id="default",
+                **extra_kwargs(params, prompt, negative),
             )
 
         if not workflow:
@@ -285,10 +337,22 @@ class MainWindow(Adw.ApplicationWindow):
         self._current_seed = actual_seed
 
         def on_progress(info: ProgressInfo):
-            GLib.idle_add(self._update_progress, info)
+            with self._progress_lock:
+                self._latest_progress = info
+                if self._progress_scheduled:
+                    return
+                self._progress_scheduled = True
+            GLib.idle_add(self._drain_progress)
 
         def on_complete(job: GenerationJob):
-            GLib.idle_add(self._on_complete, job)
+            # Pixel conversion stays on the worker; the main thread only wraps bytes
+            pixels = None
+            if job.result and job.result.success and job.result.images is not None:
+                try:
+                    pixels = self._prepare_pixels(job.result.images)
+                except Exception as e:
+                    logger.error("Error converting images: %s", e, exc_info=True)
+            GLib.idle_add(self._on_complete, job, pixels)
 
         logger.info(
             "Submitting generation (workflow=%s, model=%s, steps=%d, cfg=%.1f, seed=%s)",
@@ -300,6 +364,19 @@ class MainWindow(Adw.ApplicationWindow):
         )
         self._queue.submit(workflow=workflow, on_progress=on_progress, on_complete=on_complete)
 
+    def _drain_progress(self) -> bool:
+        """Show the most recent progress update (main thread).
+
+        Sampler steps arriving before this runs overwrite each other, so a
+        burst of steps costs one redraw.
+        """
+        with self._progress_lock:
+            info = self._latest_progress
+            self._progress_scheduled = False
+        if info is not None:
+            self._update_progress(info)
+        return False
+
     def _update_progress(self, info: ProgressInfo) -> bool:
         if info.total_steps > 0:
             progress = info.current_step / info.total_steps
@@ -308,7 +385,36 @@ class MainWindow(Adw.ApplicationWindow):
             self.bottom_bar.set_generate_label(f"Generating... {pct}%")
         return False
 
-    def _on_complete(self, job: GenerationJob) -> bool:
+    def _prepare_pixels(self, images) -> tuple[_Pixels, _Pixels] | None:
+        """Convert an image tensor to raw pixels for preview and thumbnail.
+
+        Runs on the queue worker thread so the conversion and downscale do not
+        block the main loop. The full-size image goes straight from the uint8
+        array to texture bytes; PIL is only used to shrink the thumbnail and
+        images larger than _PREVIEW_MAX_EDGE squared.
+
+        Returns:
+            (full, thumbnail) pixel tuples, or None if there is no image
+        """
+        from PIL import Image
+
+        pixels = tensor_to_uint8(images)
+        if pixels is None or len(pixels) == 0:
+            logger.warning("Generation completed but returned no images")
+            return None
+        logger.info("Generation completed successfully (images=%d)", len(pixels))
+        image = Image.fromarray(pixels[0])
+        if image.width * image.height > _PREVIEW_MAX_EDGE**2:
+            preview = image.copy()
+            preview.thumbnail((_PREVIEW_MAX_EDGE, _PREVIEW_MAX_EDGE), Image.Resampling.BILINEAR)
+            full_pixels = _image_pixels(preview)
+        else:
+            full_pixels = _array_pixels(pixels[0])
+        size = self.preview_panel.THUMB_SIZE
+        image.thumbnail((size, size), Image.Resampling.BILINEAR)
+        return full_pixels, _image_pixels(image)
+
+    def _on_complete(self, job: GenerationJob, pixels: tuple[_Pixels, _Pixels] | None) -> bool:
         logger.info("_on_complete called: result=%s", job.result is not None)
         if job.result:
             logger.info(
@@ -317,34 +423,22 @@ class MainWindow(Adw.ApplicationWindow):
                 job.result.images is not None,
                 job.result.error,
             )
-        if job.result and job.result.success and job.result.images is not None:
-            try:
-                images = tensor_to_pil(job.result.images)
-                if images:
-                    logger.info("Generation completed successfully (images=%d)", len(images))
-                    self._show_image(images[0])
-                else:
-                    logger.warning("Generation completed but tensor_to_pil returned empty")
-            except Exception as e:
-                logger.error("Error converting images: %s", e, exc_info=True)
+        if pixels is not None:
+            self._show_image(*pixels)
         elif job.result and not job.result.success:
             logger.error("Generation failed: %s", job.result.error)
-        else:
+        elif not job.result or job.result.images is None:
             logger.warning("No result or images in job")
         self._reset_ui()
         return False
 
-    def _show_image(self, pil_image) -> None:
-        """Convert a PIL image to a GdkPixbuf and show it in the preview."""
-        buf = io.BytesIO()
-        pil_image.save(buf, format="PNG")
-        buf.seek(0)
-        loader = GdkPixbuf.PixbufLoader.new_with_type("png")
-        loader.write(buf.read())
-        loader.close()
-        pixbuf = loader.get_pixbuf()
+    def _show_image(self, full: _Pixels, thumbnail: _Pixels) -> None:
+        """Show prepared pixels in the preview and gallery.
 
-        self.preview_panel.show_image(pixbuf)
+        The buffers are wrapped in Gdk.MemoryTexture directly, avoiding a PNG
+        encode and decode round-trip on the main thread.
+        """
+        self.preview_panel.show_image(_pixels_to_texture(full), _pixels_to_texture(thumbnail))
 
         if self._current_seed is not None:
             self.control_panel.set_seed_text(str(self._current_seed))
@@ -396,21 +490,35 @@ class MainWindow(Adw.ApplicationWindow):
     # ComfyUI Initialization
     # =========================================================================
 
-    def _init_comfy(self) -> None:
-        """Initialize ComfyUI in a background thread."""
+    def _init_comfy(self, task, _source, _data, _cancellable) -> None:
+        """Initialize ComfyUI on a Gio.Task worker thread.
+
+        The checkpoint scan needs the engine initialized by get_queue(), so
+        the two calls run in sequence. The outcome is stashed on self and
+        handled by _on_comfy_init_done on the main thread.
+        """
         logger.info("Initializing ComfyUI...")
         try:
             self._queue = get_queue()
-            checkpoints = get_available_checkpoints()
-            logger.info("ComfyUI initialized (checkpoints=%d)", len(checkpoints))
-            GLib.idle_add(self._on_ready, checkpoints)
+            self._init_result = get_available_checkpoints()
+            logger.info("ComfyUI initialized (checkpoints=%d)", len(self._init_result))
+            task.return_boolean(True)
         except Exception as e:
             logger.error("ComfyUI initialization failed: %s", e, exc_info=True)
-            GLib.idle_add(self._on_error, str(e))
+            self._init_result = str(e)
+            task.return_boolean(False)
+
+    def _on_comfy_init_done(self, _source, result, _data) -> None:
+        """Gio.Task completion callback -- runs on main thread."""
+        if result.propagate_boolean():
+            self._on_ready(self._init_result)
+        else:
+            self._on_error(self._init_result)
 
     def _on_ready(self, checkpoints: list[str]) -> bool:
         """ComfyUI ready -- runs on main thread."""
         logger.info("Main window ready")
+        self._get_vram = self._queue.engine.get_vram_usage
         self.control_panel.set_checkpoints(checkpoints)
         # Trigger workflow change to filter models
         self.control_panel._on_workflow_changed(self.control_panel._workflow_dropdown, None)
@@ -447,11 +555,44 @@ class MainWindow(Adw.ApplicationWindow):
     # VRAM monitoring
     # =========================================================================
 
+    def _schedule_vram_poll(self) -> None:
+        """Arm the next VRAM poll: frequent while generating, slow when idle.
+
+        Second-granularity timers let GLib coalesce wakeups with other timers.
+        """
+        if self._vram_source:
+            GLib.source_remove(self._vram_source)
+        interval = _VRAM_POLL_BUSY_S if self._generating else _VRAM_POLL_IDLE_S
+        self._vram_source = GLib.timeout_add_seconds(interval, self._poll_vram)
+
+    def _poll_vram(self) -> bool:
+        """VRAM timer callback; re-arms itself at the interval for the current state."""
+        # This source ends when we return False; don't let re-arming remove it
+        self._vram_source = 0
+        self._update_vram()
+        self._schedule_vram_poll()
+        return False
+
+    def _on_destroy(self, _window) -> None:
+        """Stop polling VRAM once the window is gone."""
+        if self._vram_source:
+            GLib.source_remove(self._vram_source)
+            self._vram_source = 0
+
     def _update_vram(self) -> bool:
-        """Periodic VRAM usage update (called by GLib.timeout_add)."""
-        if self._queue and self._queue.engine._initialized:
-            used, total = self._queue.engine.get_vram_usage()
-            self.bottom_bar.set_vram(used, total)
+        """Refresh the VRAM display from the engine.
+
+        Skipped while the window is unmapped, and widgets are only touched
+        when the reading changes at the 0.1 GB resolution the label shows.
+        """
+        if not self.get_mapped():
+            return True
+        if self._get_vram is not None:
+            used, total = self._get_vram()
+            tenths = (round(used / 1e8), round(total / 1e8))
+            if tenths != self._last_vram_tenths:
+                self._last_vram_tenths = tenths
+                self.bottom_bar.set_vram(used, total)
         return True
 
     # =========================================================================
@@ -491,4 +632,5 @@ class MainWindow(Adw.ApplicationWindow):
 
     def set_vram_usage(self, used_gb: float, total_gb: float) -> None:
         """Update VRAM display (external API)."""
+        self._last_vram_tenths = None  # Let the next poll redraw over this value
         self.bottom_bar.set_vram(int(used_gb * 1e9), int(total_gb * 1e9))
@@ -1,5 +1,6 @@
 """Model download dialog."""
 
+import threading
 from pathlib import Path
 
 from ..core.logging import get_logger
@@ -11,19 +12,22 @@ try:
 
     gi.require_version("Gtk", "4.0")
     gi.require_version("Adw", "1")
-    from gi.repository import Adw, GLib, Gtk, Pango
+    from gi.repository import Adw, Gio, GLib, GObject, Gtk, Pango
 except (ImportError, ValueError):
     pass
 
-from ..core.downloader import DownloadProgress, DownloadResult, ModelDownloader
+from ..core.downloader import (
+    _CANCELLED_ERROR,
+    DownloadProgress,
+    DownloadResult,
+    ModelDownloader,
+)
 from ..core.models import (
-    MODEL_CATALOG,
     ModelInfo,
     ModelType,
     QualityTier,
     get_models_by_type,
     get_recommended_models,
-    is_model_installed,
 )
 
 # Section descriptions for beginners
@@ -36,24 +40,214 @@ SECTION_DESCRIPTIONS = {
     ModelType.UPSCALER: "Make your generated images larger without losing quality.",
 }
 
+# Seconds between disk space refreshes while the dialog is open
+_DISK_SPACE_REFRESH_S = 10
+
+# Tallest a section's model list grows before it scrolls, in pixels
+_MODEL_LIST_MAX_HEIGHT = 360
+
+# Display order of the per-type sections
+_SECTION_ORDER = (
+    ModelType.CHECKPOINT,
+    ModelType.CLIP_VISION,
+    ModelType.TEXT_ENCODER,
+    ModelType.CONTROLNET,
+    ModelType.VAE,
+    ModelType.UPSCALER,
+)
+_TYPE_NAMES = {t: t.value.replace("_", " ").upper() for t in ModelType}
+
+
+class _ModelItem(GObject.Object):
+    """List item wrapping a catalog entry for the model list views.
+
+    Row widgets bind to ``installed``, so setting it updates whichever row
+    currently shows this item and nothing else.
+    """
+
+    installed = GObject.Property(type=bool, default=False)
+
+    def __init__(self, model: ModelInfo, highlight: bool = False, installed: bool = False):
+        super().__init__(installed=installed)
+        self.model = model
+        self.highlight = highlight
+
+
+class _ModelRow(Gtk.Box):
+    """Reusable row widget; list views rebind it to different models."""
+
+    def __init__(self, on_download_clicked):
+        super().__init__(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
+        self.item: _ModelItem | None = None
+        self.bindings: list[GObject.Binding] = []
+        self.set_margin_start(12)
+        self.set_margin_end(12)
+        self.set_margin_top(10)
+        self.set_margin_bottom(10)
+
+        # Info column
+        info_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=4)
+        info_box.set_hexpand(True)
+        self.append(info_box)
+
+        # Name row with badges
+        name_row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
+        info_box.append(name_row)
+
+        self.name_label = Gtk.Label(xalign=0, css_classes=["heading"])
+        name_row.append(self.name_label)
+
+        self.recommended_badge = Gtk.Label(label="Recommended", css_classes=["success", "caption"])
+        name_row.append(self.recommended_badge)
+        self.high_quality_badge = Gtk.Label(label="High Quality", css_classes=["accent", "caption"])
+        name_row.append(self.high_quality_badge)
+        self.starter_badge = Gtk.Label(label="Beginner Friendly", css_classes=["caption"])
+        name_row.append(self.starter_badge)
+
+        # Tips (if available) live in a popover, so they are only laid out when opened
+        self.tips_label = Gtk.Label(
+            xalign=0,
+            css_classes=["caption"],
+            wrap=True,
+            wrap_mode=Pango.WrapMode.WORD_CHAR,
+            max_width_chars=40,
+        )
+        self.tips_label.set_margin_start(6)
+        self.tips_label.set_margin_end(6)
+        self.tips_label.set_margin_top(6)
+        self.tips_label.set_margin_bottom(6)
+        self.tips_button = Gtk.MenuButton(
+            icon_name="dialog-information-symbolic",
+            popover=Gtk.Popover(child=self.tips_label),
+            css_classes=["flat"],
+            tooltip_text="Tips",
+        )
+        name_row.append(self.tips_button)
+
+        # Description: one ellipsized line; clicking the row wraps it in full
+        self.desc_label = Gtk.Label(
+            xalign=0,
+            css_classes=["dim-label"],
+            ellipsize=Pango.EllipsizeMode.END,
+            wrap_mode=Pango.WrapMode.WORD_CHAR,
+        )
+        info_box.append(self.desc_label)
+
+        expand_click = Gtk.GestureClick()
+        expand_click.connect("released", self._on_info_clicked)
+        info_box.add_controller(expand_click)
+
+        # Right side: size, VRAM, status, button
+        right_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=4)
+        right_box.set_valign(Gtk.Align.CENTER)
+        self.append(right_box)
+
+        # Size and VRAM info
+        specs_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
+        specs_box.set_halign(Gtk.Align.END)
+        right_box.append(specs_box)
+
+        self.size_label = Gtk.Label(css_classes=["dim-label", "caption"])
+        self.size_label.set_tooltip_text("Download size")
+        specs_box.append(self.size_label)
+
+        self.vram_label = Gtk.Label(css_classes=["dim-label", "caption"])
+        self.vram_label.set_tooltip_text("Minimum GPU memory required")
+        specs_box.append(self.vram_label)
+
+        # Status and button row
+        button_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
+        button_box.set_halign(Gtk.Align.END)
+        right_box.append(button_box)
+
+        self.status_label = Gtk.Label(label="")
+        self.status_label.set_width_chars(10)
+        button_box.append(self.status_label)
+
+        # The slot's sensitivity follows the dialog's download state, the button's
+        # own follows the model's installed state; GTK combines the two
+        self.button_slot = Gtk.Box()
+        button_box.append(self.button_slot)
+
+        self.button = Gtk.Button(label="Download")
+        self.button.connect("clicked", lambda btn: on_download_clicked(btn, self.item.model))
+        self.button_slot.append(self.button)
+
+    def bind(self, item: _ModelItem) -> None:
+        """Show a model's details in this row."""
+        self.item = item
+        model = item.model
+        self.name_label.set_label(model.name)
+        self.recommended_badge.set_visible(model.recommended)
+        self.high_quality_badge.set_visible(model.quality_tier == QualityTier.HIGH)
+        self.starter_badge.set_visible(model.quality_tier == QualityTier.STARTER)
+        self.desc_label.set_label(model.description)
+        self._set_description_wrapped(False)
+        self.tips_label.set_label(model.tips)
+        self.tips_button.set_visible(bool(model.tips))
+        self.size_label.set_label(model.size_label)
+        self.vram_label.set_label(model.vram_label)
+        if item.highlight:
+            self.button.add_css_class("suggested-action")
+        else:
+            self.button.remove_css_class("suggested-action")
+
+    def _set_description_wrapped(self, wrapped: bool) -> None:
+        self.desc_label.set_wrap(wrapped)
+        self.desc_label.set_ellipsize(
+            Pango.EllipsizeMode.NONE if wrapped else Pango.EllipsizeMode.END
+        )
+
+    def _on_info_clicked(self, *_args) -> None:
+        self._set_description_wrapped(not self.desc_label.get_wrap())
+
 
 class ModelDownloadDialog(Adw.Dialog):
     """Dialog for browsing and downloading models."""
 
+    # Bound (inverted) to every row's download button slot
+    downloading = GObject.Property(type=bool, default=False)
+
     def __init__(self, models_dir: Path, **kwargs):
         super().__init__(**kwargs)
 
         self.models_dir = models_dir
         self.downloader = ModelDownloader(models_dir)
-        self._download_buttons: dict[str, Gtk.Button] = {}
-        self._status_labels: dict[str, Gtk.Label] = {}
+        # List items per model id; a model can be listed in more than one section
+        self._items_by_id: dict[str, list[_ModelItem]] = {}
+        # Installed model ids, scanned once per dialog and updated as downloads finish
+        self._installed: set[str] = set()
+
+        # Latest download progress, handed from the download thread to the main loop
+        self._latest_progress: DownloadProgress | None = None
+        self._progress_scheduled = False
+        self._progress_lock = threading.Lock()
+
+        self._error_dialog: Adw.AlertDialog | None = None
+        self._populated_sections: set[ModelType] = set()
+
+        # One factory builds and rebinds rows for every model list
+        self._row_factory = Gtk.SignalListItemFactory()
+        self._row_factory.connect("setup", self._on_row_setup)
+        self._row_factory.connect("bind", self._on_row_bind)
+        self._row_factory.connect("unbind", self._on_row_unbind)
 
         self.set_title("Download Models")
         self.set_content_width(500)
         self.set_content_height(600)
 
         self._build_ui()
-        self._refresh_status()
+        # Only touched on the main thread; at most one disk space read in flight
+        self._disk_fetch_running = False
+        # Free MB from the last background read, None until one succeeds
+        self._free_mb: float | None = None
+        self._refresh_disk_space()
+        # Keep the free-space figure current while a large download fills the disk
+        self._disk_space_timer = GLib.timeout_add_seconds(
+            _DISK_SPACE_REFRESH_S, self._refresh_disk_space
+        )
+        self.connect("close-attempt", self._on_close_attempt)
+        self.connect("closed", self._on_closed)
 
     def _build_ui(self):
         """Build the dialog UI."""
@@ -105,49 +299,39 @@ class ModelDownloadDialog(Adw.Dialog):
         content_box.set_margin_bottom(16)
         scroll.set_child(content_box)
 
-        # Disk space info
-        free_mb, total_mb = self.downloader.get_disk_space_mb()
-        space_label = Gtk.Label(
-            label=f"Disk space: {free_mb / 1024:.1f} GB free of {total_mb / 1024:.1f} GB",
+        # Disk space info, filled in from a worker thread so statvfs can't stall opening
+        self.space_label = Gtk.Label(
+            label="Checking disk space…",
             xalign=0,
             css_classes=["dim-label"],
         )
-        content_box.append(space_label)
+        content_box.append(self.space_label)
 
         # =====================================================================
         # GETTING STARTED SECTION
         # =====================================================================
-        recommended = get_recommended_models()
-        if recommended:
-            # Check if any recommended models are not installed
-            has_uninstalled = any(not is_model_installed(m, self.models_dir) for m in recommended)
-            if has_uninstalled:
-                self._build_getting_started_section(content_box, recommended)
+        # One directory scan per model type instead of a stat per catalog entry;
+        # reused for the rest of the dialog session
+        self._installed = set(self.downloader.get_installed_models())
+        missing = [m for m in get_recommended_models() if m.id not in self._installed]
+        if missing:
+            self._build_getting_started_section(content_box, missing)
 
         # =====================================================================
         # MODEL SECTIONS BY TYPE
         # =====================================================================
-        type_order = [
-            ModelType.CHECKPOINT,
-            ModelType.CLIP_VISION,
-            ModelType.TEXT_ENCODER,
-            ModelType.CONTROLNET,
-            ModelType.VAE,
-            ModelType.UPSCALER,
-        ]
-
-        for model_type in type_order:
+        for model_type in _SECTION_ORDER:
+            # Pre-grouped by the catalog at import; a dict lookup, not a scan
             models = get_models_by_type(model_type)
             if not models:
                 continue
 
             # Section header with description
-            type_name = model_type.value.replace("_", " ").upper()
             header_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=4)
             header_box.set_margin_top(12)
 
             header_label = Gtk.Label(
-                label=type_name,
+                label=_TYPE_NAMES[model_type],
                 xalign=0,
                 css_classes=["heading"],
             )
@@ -164,24 +348,32 @@ class ModelDownloadDialog(Adw.Dialog):
                 )
                 header_box.append(desc_label)
 
-            content_box.append(header_box)
-
-            # Model list for this type
-            list_box = Gtk.ListBox(
-                selection_mode=Gtk.SelectionMode.NONE,
-                css_classes=["boxed-list"],
-            )
-            content_box.append(list_box)
-
-            for model in models:
-                row = self._create_model_row(model)
-                list_box.append(row)
+            # Model list for this type, built the first time the section opens
+            expander = Gtk.Expander(label_widget=header_box)
+            expander.connect("notify::expanded", self._on_section_expanded, model_type, models)
+            content_box.append(expander)
+            if model_type == ModelType.CHECKPOINT:
+                expander.set_expanded(True)
 
         # Store current download model for retry
         self._current_download_model: ModelInfo | None = None
 
-    def _build_getting_started_section(self, content_box: Gtk.Box, recommended: list[ModelInfo]):
-        """Build the Getting Started section for new users."""
+    def _on_section_expanded(self, expander, _pspec, model_type: ModelType, models):
+        """Populate a model section on first expand."""
+        if model_type in self._populated_sections or not expander.get_expanded():
+            return
+        self._populated_sections.add(model_type)
+        model_list = self._create_model_list(models)
+        model_list.set_margin_top(8)
+        expander.set_child(model_list)
+
+    def _build_getting_started_section(self, content_box: Gtk.Box, missing: list[ModelInfo]):
+        """Build the Getting Started section for new users.
+
+        Args:
+            content_box: Container to append the section to
+            missing: Recommended models that are not installed yet
+        """
         # Frame with special styling
         frame = Gtk.Frame()
         frame.add_css_class("view")
@@ -212,161 +404,110 @@ class ModelDownloadDialog(Adw.Dialog):
         frame_box.append(welcome)
 
         # Recommended models list
-        list_box = Gtk.ListBox(
-            selection_mode=Gtk.SelectionMode.NONE,
-            css_classes=["boxed-list"],
-        )
-        frame_box.append(list_box)
-
-        for model in recommended:
-            if not is_model_installed(model, self.models_dir):
-                row = self._create_model_row(model, highlight=True)
-                list_box.append(row)
+        frame_box.append(self._create_model_list(missing, highlight=True))
 
         content_box.append(frame)
 
-    def _create_model_row(self, model: ModelInfo, highlight: bool = False) -> Gtk.ListBoxRow:
-        """Create a row for a model.
+    def _create_model_list(self, models, highlight: bool = False) -> Gtk.ScrolledWindow:
+        """Create a scrollable list view of models.
+
+        Rows are built by the shared factory and rebound as the view recycles
+        them, rather than one widget tree per catalog entry. The list view
+        must be the direct child of its own scrolled window: nested in the
+        dialog's outer scroll it would be given its full height and bind
+        every row.
 
         Args:
-            model: The model info
+            models: The models to list
             highlight: If True, show with emphasis (for recommended section)
         """
-        row = Gtk.ListBoxRow()
-
-        box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
-        box.set_margin_start(12)
-        box.set_margin_end(12)
-        box.set_margin_top(10)
-        box.set_margin_bottom(10)
-        row.set_child(box)
-
-        # Info column
-        info_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=4)
-        info_box.set_hexpand(True)
-        box.append(info_box)
-
-        # Name row with badges
-        name_row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
-        info_box.append(name_row)
-
-        name_label = Gtk.Label(label=model.name, xalign=0)
-        name_label.set_css_classes(["heading"])
-        name_row.append(name_label)
-
-        # Add badges
-        if model.recommended:
-            badge = Gtk.Label(label="Recommended")
-            badge.add_css_class("success")
-            badge.add_css_class("caption")
-            name_row.append(badge)
-
-        if model.quality_tier == QualityTier.HIGH:
-            badge = Gtk.Label(label="High Quality")
-            badge.add_css_class("accent")
-            badge.add_css_class("caption")
-            name_row.append(badge)
-        elif model.quality_tier == QualityTier.STARTER:
-            badge = Gtk.Label(label="Beginner Friendly")
-            badge.add_css_class("caption")
-            name_row.append(badge)
-
-        # Description
-        desc_label = Gtk.Label(
-            label=model.description,
-            xalign=0,
-            css_classes=["dim-label"],
-            wrap=True,
-            wrap_mode=Pango.WrapMode.WORD_CHAR,
-        )
-        info_box.append(desc_label)
-
-        # Tips (if available)
-        if model.tips:
-            tips_label = Gtk.Label(
-                label=model.tips,
-                xalign=0,
-                css_classes=["caption"],
-                wrap=True,
-                wrap_mode=Pango.WrapMode.WORD_CHAR,
-            )
-            tips_label.set_margin_top(4)
-            info_box.append(tips_label)
-
-        # Right side: size, VRAM, status, button
-        right_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=4)
-        right_box.set_valign(Gtk.Align.CENTER)
-        box.append(right_box)
-
-        # Size and VRAM info
-        specs_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
-        specs_box.set_halign(Gtk.Align.END)
-        right_box.append(specs_box)
-
-        size_label = Gtk.Label(
-            label=f"{model.size_mb / 1024:.1f} GB"
-            if model.size_mb >= 1024
-            else f"{model.size_mb} MB",
-            css_classes=["dim-label", "caption"],
+        # One splice emits a single items-changed instead of one per model
+        items = [_ModelItem(model, highlight, model.id in self._installed) for model in models]
+        for item in items:
+            self._items_by_id.setdefault(item.model.id, []).append(item)
+        store = Gio.ListStore(item_type=_ModelItem)
+        store.splice(0, 0, items)
+        list_view = Gtk.ListView(
+            model=Gtk.NoSelection(model=store),
+            factory=self._row_factory,
+            css_classes=["boxed-list"],
         )
-        size_label.set_tooltip_text("Download size")
-        specs_box.append(size_label)
-
-        vram_label = Gtk.Label(
-            label=f"{model.vram_gb:.0f}GB VRAM",
-            css_classes=["dim-label", "caption"],
+        # Short lists take their natural height; long ones scroll in place
+        return Gtk.ScrolledWindow(
+            child=list_view,
+            hscrollbar_policy=Gtk.PolicyType.NEVER,
+            vscrollbar_policy=Gtk.PolicyType.AUTOMATIC,
+            propagate_natural_height=True,
+            max_content_height=_MODEL_LIST_MAX_HEIGHT,
         )
-        vram_label.set_tooltip_text("Minimum GPU memory required")
-        specs_box.append(vram_label)
 
-        # Status and button row
-        button_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
-        button_box.set_halign(Gtk.Align.END)
-        right_box.append(button_box)
-
-        # Status label
-        status_label = Gtk.Label(label="")
-        status_label.set_width_chars(10)
-        button_box.append(status_label)
-        self._status_labels[model.id] = status_label
-
-        # Download button
-        button = Gtk.Button(label="Download")
-        button.connect("clicked", self._on_download_clicked, model)
-        if highlight:
-            button.add_css_class("suggested-action")
-        button_box.append(button)
-        self._download_buttons[model.id] = button
-
-        return row
-
-    def _refresh_status(self):
-        """Refresh installed status for all models."""
-        for model_id, model in MODEL_CATALOG.items():
-            if model_id not in self._status_labels:
-                continue
-
-            status_label = self._status_labels[model_id]
-            button = self._download_buttons[model_id]
+    def _on_row_setup(self, _factory, list_item):
+        list_item.set_activatable(False)
+        list_item.set_child(_ModelRow(self._on_download_clicked))
+
+    def _on_row_bind(self, _factory, list_item):
+        row = list_item.get_child()
+        item = list_item.get_item()
+        row.bind(item)
+        sync = GObject.BindingFlags.SYNC_CREATE
+        row.bindings = [
+            item.bind_property(
+                "installed",
+                row.status_label,
+                "label",
+                sync,
+                lambda _binding, installed, *_: "Installed" if installed else "",
+            ),
+            item.bind_property(
+                "installed",
+                row.status_label,
+                "css-classes",
+                sync,
+                lambda _binding, installed, *_: ["success"] if installed else [],
+            ),
+            item.bind_property(
+                "installed",
+                row.button,
+                "label",
+                sync,
+                lambda _binding, installed, *_: "Installed" if installed else "Download",
+            ),
+            item.bind_property(
+                "installed", row.button, "sensitive", sync | GObject.BindingFlags.INVERT_BOOLEAN
+            ),
+            self.bind_property(
+                "downloading",
+                row.button_slot,
+                "sensitive",
+                sync | GObject.BindingFlags.INVERT_BOOLEAN,
+            ),
+        ]
 
-            if is_model_installed(model, self.models_dir):
-                status_label.set_label("Installed")
-                status_label.set_css_classes(["success"])
-                button.set_sensitive(False)
-                button.set_label("Installed")
-            else:
-                status_label.set_label("")
-                button.set_sensitive(True)
-                button.set_label("Download")
+    def _on_row_unbind(self, _factory, list_item):
+        row = list_item.get_child()
+        for binding in row.bindings:
+            binding.unbind()
+        row.bindings = []
+        row.item = None
+
+    def _update_row_status(self, model_id: str, installed: bool):
+        """Record one model's installed state; bound rows follow via their bindings."""
+        if installed:
+            self._installed.add(model_id)
+        else:
+            self._installed.discard(model_id)
+        for item in self._items_by_id.get(model_id, ()):
+            item.installed = installed
 
     def _on_download_clicked(self, button: Gtk.Button, model: ModelInfo):
         """Handle download button click."""
         if self.downloader.is_downloading:
             return
 
-        # Check disk space
-        if not self.downloader.check_disk_space(model.size_mb):
-            free_mb, _ = self.downloader.get_disk_space_mb()
+        # Advisory check against the last background reading, so the click never
+        # blocks on statvfs; download() repeats the check on its worker thread
+        free_mb = self._free_mb
+        if free_mb is not None and not self.downloader.has_room_for(model.size_mb, free_mb):
             logger.warning(
                 "Insufficient disk space for %s (need=%dMB, free=%.0fMB)",
                 model.name,
@@ -383,9 +524,10 @@ class ModelDownloadDialog(Adw.Dialog):
         # Store current model for retry
         self._current_download_model = model
 
-        # Disable all download buttons
-        for btn in self._download_buttons.values():
-            btn.set_sensitive(False)
+        # Disable all download buttons, including rows bound later
+        self.downloading = True
+        # Closing now would cancel the download; ask first (see _on_close_attempt)
+        self.set_can_close(False)
 
         # Show progress with cancel button
         self.progress_box.set_visible(True)
@@ -398,10 +540,62 @@ class ModelDownloadDialog(Adw.Dialog):
         # Start async download
         self.downloader.download_async(
             model,
-            progress_callback=lambda p: GLib.idle_add(self._on_progress, p),
+            progress_callback=self._post_progress,
             complete_callback=lambda r: GLib.idle_add(self._on_complete, r),
         )
 
+    def _refresh_disk_space(self) -> bool:
+        """Read disk space on a worker thread; the label updates when it returns."""
+        # Skip this tick if the previous read is still stuck in statvfs
+        if not self._disk_fetch_running:
+            self._disk_fetch_running = True
+            threading.Thread(target=self._fetch_disk_space, daemon=True).start()
+        return True
+
+    def _fetch_disk_space(self):
+        try:
+            space = self.downloader.get_disk_space_mb()
+        except OSError as e:
+            logger.warning("Could not read disk space for %s: %s", self.models_dir, e)
+            space = None
+        GLib.idle_add(self._apply_disk_space, space)
+
+    def _apply_disk_space(self, space: tuple[float, float] | None) -> bool:
+        self._disk_fetch_running = False
+        if space is None:
+            self._free_mb = None
+            self.space_label.set_label("Disk space: unavailable")
+        else:
+            free_mb, total_mb = space
+            self._free_mb = free_mb
+            self.space_label.set_label(
+                f"Disk space: {free_mb / 1024:.1f} GB free of {total_mb / 1024:.1f} GB"
+            )
+        return False
+
+    def _on_close_attempt(self, _dialog):
+        """Confirm before a close cancels the running download."""
+        name = self._current_download_model.name if self._current_download_model else "the model"
+        dialog = Adw.AlertDialog.new(
+            "Stop Download?", f"Closing this window cancels the download of {name}."
+        )
+        dialog.add_response("keep", "_Keep Downloading")
+        dialog.add_response("stop", "_Stop and Close")
+        dialog.set_response_appearance("stop", Adw.ResponseAppearance.DESTRUCTIVE)
+        dialog.set_default_response("keep")
+        dialog.set_close_response("keep")
+        dialog.connect("response", self._on_close_confirm_response)
+        dialog.present(self)
+
+    def _on_close_confirm_response(self, _dialog, response_id):
+        if response_id == "stop":
+            self.force_close()
+
+    def _on_closed(self, _dialog):
+        """Stop any in-flight download once the dialog is gone."""
+        GLib.source_remove(self._disk_space_timer)
+        self.downloader.shutdown()
+
     def _on_cancel_clicked(self, button: Gtk.Button):
         """Handle cancel button click."""
         logger.info("Download cancel requested")
@@ -410,6 +604,29 @@ class ModelDownloadDialog(Adw.Dialog):
         self.progress_label.set_label("Cancelling download...")
         self.downloader.cancel_download()
 
+    def _post_progress(self, progress: DownloadProgress):
+        """Queue a progress update (download thread).
+
+        At most one update is pending on the main loop; newer updates replace
+        it rather than queueing another idle callback.
+        """
+        with self._progress_lock:
+            self._latest_progress = progress
+            if self._progress_scheduled:
+                return
+            self._progress_scheduled = True
+        # Below redraw and input so a fast download can't crowd out the UI
+        GLib.idle_add(self._drain_progress, priority=GLib.PRIORITY_LOW)
+
+    def _drain_progress(self) -> bool:
+        """Show the most recent progress update (main thread)."""
+        with self._progress_lock:
+            progress = self._latest_progress
+            self._progress_scheduled = False
+        if progress is not None:
+            self._on_progress(progress)
+        return False
+
     def _on_progress(self, progress: DownloadProgress):
         """Handle download progress update."""
         self.progress_bar.set_fraction(progress.progress)
@@ -430,14 +647,21 @@ class ModelDownloadDialog(Adw.Dialog):
 
     def _on_complete(self, result: DownloadResult):
         """Handle download completion."""
+        self.set_can_close(True)
+        # A low-priority progress update may still be pending; don't let it
+        # overwrite the completion state
+        with self._progress_lock:
+            self._latest_progress = None
         if result.success:
             logger.info(
                 "Download completed successfully (model=%s, path=%s)", result.model_id, result.path
             )
+            # Only the downloaded model changed; no need to rescan the models directory
+            self._update_row_status(result.model_id, True)
             self._show_success()
         else:
             logger.error("Download failed (model=%s): %s", result.model_id, result.error)
-            if result.error == "Download cancelled":
+            if result.error == _CANCELLED_ERROR:
                 self._show_cancelled()
             else:
                 self._show_error_with_retry(result.error)
@@ -454,7 +678,6 @@ class ModelDownloadDialog(Adw.Dialog):
         # Auto-hide after 2 seconds and refresh
         def hide_and_refresh():
             self.progress_box.set_visible(False)
-            self._refresh_status()
             self._re_enable_buttons()
             self._current_download_model = None
             return False
@@ -470,7 +693,6 @@ class ModelDownloadDialog(Adw.Dialog):
         # Auto-hide after 1.5 seconds
         def hide_and_reset():
             self.progress_box.set_visible(False)
-            self._refresh_status()
             self._re_enable_buttons()
             self._current_download_model = None
             return False
@@ -501,7 +723,6 @@ class ModelDownloadDialog(Adw.Dialog):
             self._on_download_clicked(None, self._current_download_model)
         else:
             # Reset UI state
-            self._refresh_status()
             self._re_enable_buttons()
             self._current_download_model = None
 
@@ -548,15 +769,19 @@ class ModelDownloadDialog(Adw.Dialog):
 
     def _re_enable_buttons(self):
         """Re-enable download buttons for uninstalled models."""
-        for model_id, btn in self._download_buttons.items():
-            model = MODEL_CATALOG.get(model_id)
-            if model and not is_model_installed(model, self.models_dir):
-                btn.set_sensitive(True)
+        self.downloading = False
 
     def _show_error(self, message: str):
-        """Show a simple error message (no retry)."""
-        logger.error("UI error shown: %s", message)
+        """Show a simple error message (no retry).
+
+        The alert is created on first use and reused for later errors.
+        """
         title, guidance = self._get_error_guidance(message)
-        dialog = Adw.AlertDialog.new(title, guidance)
-        dialog.add_response("ok", "_OK")
-        dialog.present(self)
+        if self._error_dialog is None:
+            self._error_dialog = Adw.AlertDialog.new(title, guidance)
+            self._error_dialog.add_response("ok", "_OK")
+        else:
+            self._error_dialog.set_heading(title)
+            self._error_dialog.set_body(guidance)
+        if self._error_dialog.get_parent() is None:
+            self._error_dialog.present(self)
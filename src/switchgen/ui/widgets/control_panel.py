@@ -22,6 +22,13 @@ except (ImportError, ValueError):
 
 from ...core import WORKFLOW_SPECS, WorkflowType, get_models_for_workflow
 
+# Workflow dropdown entries, in dropdown index order
+_WORKFLOW_LIST = tuple(WorkflowType)
+_WORKFLOW_NAMES = [WORKFLOW_SPECS[wt].name for wt in _WORKFLOW_LIST]
+
+# Audio duration in seconds, reported until the duration row is first built
+_DEFAULT_DURATION = 30.0
+
 # =============================================================================
 # Presets and Templates for Beginners
 # =============================================================================
@@ -148,13 +155,47 @@ class ControlPanel(Gtk.Box):
         self._current_workflow = WorkflowType.TEXT2IMG
         self._filtered_checkpoints: list[str] = []
         self._all_checkpoints: list[str] = []
+        # Filtered checkpoints per workflow, cleared when the full list changes
+        self._filter_cache: dict[WorkflowType, list[str]] = {}
+        # Checkpoints currently in the model dropdown (None until first populated)
+        self._shown_checkpoints: list[str] | None = None
         self._is_xl_model: bool = False
         self._input_image_path: str | None = None
         self._mask_image_path: str | None = None
         self._current_style: str = "none"
+        # Workflow whose layout was last applied, and the visibility flags it set
+        self._applied_workflow: WorkflowType | None = None
+        self._last_visibility: tuple[bool, ...] | None = None
+        # Latest workflow dropdown index, applied once per idle cycle
+        self._pending_workflow_idx = 0
+        self._workflow_apply_scheduled = False
+        # Audio and 3D rows are built the first time their workflow is shown
+        self._duration_spin: Gtk.SpinButton | None = None
+        self._elev_spin: Gtk.SpinButton | None = None
+        self._azim_spin: Gtk.SpinButton | None = None
+        self._duration_widgets: list[Gtk.Widget] = []
+        self._camera_widgets: list[Gtk.Widget] = []
+
+        # File dialog filters, shared by the input and mask pickers
+        image_filter = Gtk.FileFilter()
+        image_filter.set_name("Images")
+        image_filter.add_mime_type("image/*")
+        self._image_filters = Gio.ListStore.new(Gtk.FileFilter)
+        self._image_filters.append(image_filter)
 
         self._build_ui()
 
+        # Widgets shown or hidden together, in the order of the visibility flags
+        self._visibility_groups = (
+            (self._input_box,),
+            (self._mask_box,),
+            (self._prompt_box, self._neg_box),
+            (self._size_label, self._size_box),
+            (self._denoise_label, self._denoise_spin),
+            self._duration_widgets,
+            self._camera_widgets,
+        )
+
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
@@ -167,8 +208,7 @@ class ControlPanel(Gtk.Box):
         duration, elevation, azimuth.
         """
         # Prompt
-        buf = self._prompt_view.get_buffer()
-        prompt = buf.get_text(buf.get_start_iter(), buf.get_end_iter(), False)
+        prompt = self._prompt_buffer.props.text
         if prompt == _PROMPT_PLACEHOLDER:
             prompt = ""
         if not prompt.strip():
@@ -180,8 +220,7 @@ class ControlPanel(Gtk.Box):
             style_suffix = STYLE_PRESETS[self._current_style][0]
 
         # Negative
-        buf = self._neg_view.get_buffer()
-        negative = buf.get_text(buf.get_start_iter(), buf.get_end_iter(), False)
+        negative = self._neg_buffer.props.text
 
         # Checkpoint
         idx = self._model_dropdown.get_selected()
@@ -190,8 +229,11 @@ class ControlPanel(Gtk.Box):
         )
 
         # Seed
-        seed_txt = self._seed_entry.get_text().strip()
-        seed = int(seed_txt) if seed_txt.isdigit() else -1
+        # int() tolerates surrounding whitespace; negative values mean random
+        try:
+            seed = int(self._seed_entry.get_text())
+        except ValueError:
+            seed = -1
 
         return {
             "workflow": self._current_workflow,
@@ -207,14 +249,17 @@ class ControlPanel(Gtk.Box):
             "seed": seed,
             "input_image_path": self._input_image_path,
             "mask_image_path": self._mask_image_path,
-            "duration": self._duration_spin.get_value(),
-            "elevation": self._elev_spin.get_value(),
-            "azimuth": self._azim_spin.get_value(),
+            "duration": (
+                self._duration_spin.get_value() if self._duration_spin else _DEFAULT_DURATION
+            ),
+            "elevation": self._elev_spin.get_value() if self._elev_spin else 0.0,
+            "azimuth": self._azim_spin.get_value() if self._azim_spin else 0.0,
         }
 
     def set_checkpoints(self, checkpoints: list[str]) -> None:
         """Populate the full checkpoint list and refresh the dropdown."""
         self._all_checkpoints = checkpoints
+        self._filter_cache.clear()
         self._refresh_model_dropdown()
 
     def set_seed_text(self, text: str) -> None:
@@ -232,18 +277,18 @@ class ControlPanel(Gtk.Box):
         """Restore session state into the controls."""
         # Workflow
         if workflow:
-            for i, wt in enumerate(WorkflowType):
+            for i, wt in enumerate(_WORKFLOW_LIST):
                 if wt.name.lower() == workflow.lower() or wt.value == workflow:
                     self._workflow_dropdown.set_selected(i)
                     break
 
         # Prompt
         if prompt:
-            self._prompt_view.get_buffer().set_text(prompt)
+            self._prompt_buffer.set_text(prompt)
 
         # Negative
         if negative:
-            self._neg_view.get_buffer().set_text(negative)
+            self._neg_buffer.set_text(negative)
 
         # Style
         if style:
@@ -254,13 +299,11 @@ class ControlPanel(Gtk.Box):
 
     def get_session_state(self) -> dict[str, str]:
         """Return session-relevant state for persistence."""
-        buf = self._prompt_view.get_buffer()
-        prompt = buf.get_text(buf.get_start_iter(), buf.get_end_iter(), False)
+        prompt = self._prompt_buffer.props.text
         if prompt == _PROMPT_PLACEHOLDER:
             prompt = ""
 
-        buf = self._neg_view.get_buffer()
-        negative = buf.get_text(buf.get_start_iter(), buf.get_end_iter(), False)
+        negative = self._neg_buffer.props.text
 
         return {
             "last_workflow": self._current_workflow.value,
@@ -308,8 +351,7 @@ class ControlPanel(Gtk.Box):
             "\u2022 3D Novel View: Rotate around an object"
         )
         box.append(workflow_label)
-        workflow_names = [WORKFLOW_SPECS[wt].name for wt in WorkflowType]
-        self._workflow_dropdown = Gtk.DropDown.new_from_strings(workflow_names)
+        self._workflow_dropdown = Gtk.DropDown.new_from_strings(_WORKFLOW_NAMES)
         self._workflow_dropdown.connect("notify::selected", self._on_workflow_changed)
         box.append(self._workflow_dropdown)
 
@@ -410,6 +452,7 @@ class ControlPanel(Gtk.Box):
         # Prompt text view with overlay placeholder
         overlay = Gtk.Overlay()
         self._prompt_view = Gtk.TextView(wrap_mode=Gtk.WrapMode.WORD_CHAR)
+        self._prompt_buffer = self._prompt_view.get_buffer()
         self._prompt_view.set_size_request(-1, 80)
         frame = Gtk.Frame()
         frame.set_child(self._prompt_view)
@@ -427,8 +470,7 @@ class ControlPanel(Gtk.Box):
         overlay.add_overlay(self._prompt_placeholder)
 
         # Hide placeholder when the buffer has text
-        buf = self._prompt_view.get_buffer()
-        buf.connect("changed", self._on_prompt_buffer_changed)
+        self._prompt_buffer.connect("changed", self._on_prompt_buffer_changed)
         container.append(overlay)
 
         # Style preset buttons
@@ -467,6 +509,7 @@ class ControlPanel(Gtk.Box):
         container.append(neg_header)
 
         self._neg_view = Gtk.TextView(wrap_mode=Gtk.WrapMode.WORD_CHAR)
+        self._neg_buffer = self._neg_view.get_buffer()
         self._neg_view.set_size_request(-1, 50)
         frame = Gtk.Frame()
         frame.set_child(self._neg_view)
@@ -581,118 +624,154 @@ class ControlPanel(Gtk.Box):
         self._denoise_spin.set_visible(False)
         row_idx += 1
 
-        # Duration (audio)
-        self._duration_label = Gtk.Label(label="Duration (s)", xalign=0)
-        self._duration_label.set_tooltip_text(
+        # Duration (audio) and camera angles (3D) are built on first use
+        self._params_grid = grid
+        self._duration_row = row_idx
+        self._camera_row = row_idx + 1
+        row_idx += 3
+
+        # Seed
+        seed_label = Gtk.Label(label="Seed", xalign=0)
+        seed_label.set_tooltip_text(
+            "Random number that determines the output.\n"
+            "\u2022 Empty/Random: Different result each time\n"
+            "\u2022 Same seed + same settings = same image\n"
+            "Use this to recreate or refine results."
+        )
+        grid.attach(seed_label, 0, row_idx, 1, 1)
+        self._seed_entry = Gtk.Entry(placeholder_text="Random")
+        self._seed_entry.set_tooltip_text(
+            "Leave empty for random, or enter a number to reproduce results"
+        )
+        grid.attach(self._seed_entry, 1, row_idx, 1, 1)
+
+        parent.append(grid)
+
+    def _ensure_duration_row(self) -> None:
+        """Build the audio duration row the first time it is needed."""
+        if self._duration_spin is not None:
+            return
+        grid, row_idx = self._params_grid, self._duration_row
+        duration_label = Gtk.Label(label="Duration (s)", xalign=0)
+        duration_label.set_tooltip_text(
             "Length of audio to generate in seconds.\nLonger durations take more time and VRAM."
         )
-        grid.attach(self._duration_label, 0, row_idx, 1, 1)
+        grid.attach(duration_label, 0, row_idx, 1, 1)
         self._duration_spin = Gtk.SpinButton.new_with_range(1.0, 60.0, 1.0)
-        self._duration_spin.set_value(30.0)
+        self._duration_spin.set_value(_DEFAULT_DURATION)
         self._duration_spin.set_digits(0)
         self._duration_spin.set_tooltip_text("Start with 10-30 seconds")
         grid.attach(self._duration_spin, 1, row_idx, 1, 1)
-        self._duration_label.set_visible(False)
-        self._duration_spin.set_visible(False)
-        row_idx += 1
+        self._duration_widgets.extend((duration_label, self._duration_spin))
+
+    def _ensure_camera_rows(self) -> None:
+        """Build the 3D elevation and azimuth rows the first time they are needed."""
+        if self._elev_spin is not None:
+            return
+        grid, row_idx = self._params_grid, self._camera_row
 
         # Elevation (3D)
-        self._elev_label = Gtk.Label(label="Elevation", xalign=0)
-        self._elev_label.set_tooltip_text(
+        elev_label = Gtk.Label(label="Elevation", xalign=0)
+        elev_label.set_tooltip_text(
             "Camera angle up/down from the object.\n"
             "\u2022 Positive: Looking down at object\n"
             "\u2022 Negative: Looking up at object\n"
             "\u2022 0: Eye level"
         )
-        grid.attach(self._elev_label, 0, row_idx, 1, 1)
+        grid.attach(elev_label, 0, row_idx, 1, 1)
         self._elev_spin = Gtk.SpinButton.new_with_range(-90, 90, 5)
         self._elev_spin.set_value(0)
         self._elev_spin.set_tooltip_text("Vertical camera angle in degrees")
         grid.attach(self._elev_spin, 1, row_idx, 1, 1)
-        self._elev_label.set_visible(False)
-        self._elev_spin.set_visible(False)
         row_idx += 1
 
         # Azimuth (3D)
-        self._azim_label = Gtk.Label(label="Azimuth", xalign=0)
-        self._azim_label.set_tooltip_text(
+        azim_label = Gtk.Label(label="Azimuth", xalign=0)
+        azim_label.set_tooltip_text(
             "Camera rotation around the object.\n"
             "\u2022 0: Same angle as input\n"
             "\u2022 90: Right side view\n"
             "\u2022 -90: Left side view\n"
             "\u2022 180: Back view"
         )
-        grid.attach(self._azim_label, 0, row_idx, 1, 1)
+        grid.attach(azim_label, 0, row_idx, 1, 1)
         self._azim_spin = Gtk.SpinButton.new_with_range(-180, 180, 5)
         self._azim_spin.set_value(0)
         self._azim_spin.set_tooltip_text("Horizontal camera angle in degrees")
         grid.attach(self._azim_spin, 1, row_idx, 1, 1)
-        self._azim_label.set_visible(False)
-        self._azim_spin.set_visible(False)
-        row_idx += 1
-
-        # Seed
-        seed_label = Gtk.Label(label="Seed", xalign=0)
-        seed_label.set_tooltip_text(
-            "Random number that determines the output.\n"
-            "\u2022 Empty/Random: Different result each time\n"
-            "\u2022 Same seed + same settings = same image\n"
-            "Use this to recreate or refine results."
-        )
-        grid.attach(seed_label, 0, row_idx, 1, 1)
-        self._seed_entry = Gtk.Entry(placeholder_text="Random")
-        self._seed_entry.set_tooltip_text(
-            "Leave empty for random, or enter a number to reproduce results"
-        )
-        grid.attach(self._seed_entry, 1, row_idx, 1, 1)
-
-        parent.append(grid)
+        self._camera_widgets.extend((elev_label, self._elev_spin, azim_label, self._azim_spin))
 
     # ------------------------------------------------------------------
     # Event handlers
     # ------------------------------------------------------------------
 
     def _on_workflow_changed(self, dropdown, _param) -> None:
-        """Handle workflow selection change."""
-        idx = dropdown.get_selected()
-        workflows = list(WorkflowType)
-        if idx >= len(workflows):
+        """Handle workflow selection change.
+
+        notify::selected can fire several times for one user action, so the
+        latest selection is applied once from an idle callback.
+        """
+        self._pending_workflow_idx = dropdown.get_selected()
+        if not self._workflow_apply_scheduled:
+            self._workflow_apply_scheduled = True
+            GLib.idle_add(self._apply_workflow_change_idle)
+
+    def _apply_workflow_change_idle(self) -> bool:
+        """Apply the most recent workflow selection (GLib idle callback)."""
+        self._workflow_apply_scheduled = False
+        self._apply_workflow_change(self._pending_workflow_idx)
+        return False
+
+    def _apply_workflow_change(self, idx: int) -> None:
+        """Update the model list and parameter layout for the selected workflow."""
+        if idx >= len(_WORKFLOW_LIST):
+            return
+
+        # notify::selected also fires for programmatic resets; skip if nothing changed
+        if _WORKFLOW_LIST[idx] == self._applied_workflow:
             return
 
-        self._current_workflow = workflows[idx]
+        self._current_workflow = _WORKFLOW_LIST[idx]
         spec = WORKFLOW_SPECS[self._current_workflow]
         logger.debug("Workflow changed to %s", self._current_workflow.name)
 
         self._refresh_model_dropdown()
 
-        # Show/hide sections based on workflow needs
-        self._input_box.set_visible(spec.needs_input_image)
-        self._mask_box.set_visible(spec.needs_mask)
-        self._prompt_box.set_visible(spec.needs_prompt)
-        self._neg_box.set_visible(spec.needs_prompt)
-
-        # Show/hide parameters
-        self._size_label.set_visible(spec.needs_size)
-        self._size_box.set_visible(spec.needs_size)
-
-        is_img2img = self._current_workflow in (WorkflowType.IMG2IMG, WorkflowType.INPAINT)
-        self._denoise_label.set_visible(is_img2img)
-        self._denoise_spin.set_visible(is_img2img)
-
+        # Show/hide sections and parameters, touching only groups that flipped
         is_audio = self._current_workflow == WorkflowType.AUDIO
-        self._duration_label.set_visible(is_audio)
-        self._duration_spin.set_visible(is_audio)
-
         is_3d = self._current_workflow == WorkflowType.THREE_D
-        self._elev_label.set_visible(is_3d)
-        self._elev_spin.set_visible(is_3d)
-        self._azim_label.set_visible(is_3d)
-        self._azim_spin.set_visible(is_3d)
-
-        # Set defaults from spec
-        self._steps_spin.set_value(spec.default_steps)
-        self._cfg_spin.set_value(spec.default_cfg)
-        self._denoise_spin.set_value(spec.default_denoise)
+        if is_audio:
+            self._ensure_duration_row()
+        if is_3d:
+            self._ensure_camera_rows()
+        visibility = (
+            spec.needs_input_image,
+            spec.needs_mask,
+            spec.needs_prompt,
+            spec.needs_size,
+            self._current_workflow in (WorkflowType.IMG2IMG, WorkflowType.INPAINT),
+            is_audio,
+            is_3d,
+        )
+        previous = self._last_visibility or (None,) * len(visibility)
+        for widgets, visible, was_visible in zip(
+            self._visibility_groups, visibility, previous, strict=True
+        ):
+            if visible != was_visible:
+                for widget in widgets:
+                    widget.set_visible(visible)
+        self._last_visibility = visibility
+
+        # Set defaults from spec, without emitting value-changed for no-ops
+        for spin, value in (
+            (self._steps_spin, spec.default_steps),
+            (self._cfg_spin, spec.default_cfg),
+            (self._denoise_spin, spec.default_denoise),
+        ):
+            if spin.get_value() != value:
+                spin.set_value(value)
+
+        self._applied_workflow = self._current_workflow
 
         if self.on_workflow_changed:
             self.on_workflow_changed()
@@ -742,7 +821,7 @@ class ControlPanel(Gtk.Box):
         template_keys = list(PROMPT_TEMPLATES.keys())
         if idx - 1 < len(template_keys):
             key = template_keys[idx - 1]
-            self._prompt_view.get_buffer().set_text(PROMPT_TEMPLATES[key])
+            self._prompt_buffer.set_text(PROMPT_TEMPLATES[key])
             logger.debug("Template inserted: %s", key)
         dropdown.set_selected(0)
 
@@ -754,27 +833,25 @@ class ControlPanel(Gtk.Box):
             logger.debug("Style changed: %s", self._current_style)
 
     def _on_use_default_negative(self, _button) -> None:
-        self._neg_view.get_buffer().set_text(DEFAULT_NEGATIVE)
+        self._neg_buffer.set_text(DEFAULT_NEGATIVE)
         logger.debug("Default negative prompt applied")
 
     def _on_prompt_buffer_changed(self, buf) -> None:
         """Toggle the overlay placeholder based on buffer contents."""
-        text = buf.get_text(buf.get_start_iter(), buf.get_end_iter(), False)
-        self._prompt_placeholder.set_visible(len(text) == 0)
+        self._prompt_placeholder.set_visible(buf.get_char_count() == 0)
 
     # ------------------------------------------------------------------
     # File pickers
     # ------------------------------------------------------------------
 
+    def _pick_image(self, title: str, callback: Callable) -> None:
+        """Open an image file dialog using the shared image filter."""
+        dialog = Gtk.FileDialog(title=title)
+        dialog.set_filters(self._image_filters)
+        dialog.open(self.get_root(), None, callback)
+
     def _pick_input_image(self, _btn) -> None:
-        dialog = Gtk.FileDialog(title="Select Input Image")
-        f = Gtk.FileFilter()
-        f.set_name("Images")
-        f.add_mime_type("image/*")
-        filters = Gio.ListStore.new(Gtk.FileFilter)
-        filters.append(f)
-        dialog.set_filters(filters)
-        dialog.open(self.get_root(), None, self._on_input_picked)
+        self._pick_image("Select Input Image", self._on_input_picked)
 
     def _on_input_picked(self, dialog, result) -> None:
         try:
@@ -786,14 +863,7 @@ class ControlPanel(Gtk.Box):
             pass
 
     def _pick_mask_image(self, _btn) -> None:
-        dialog = Gtk.FileDialog(title="Select Mask Image")
-        f = Gtk.FileFilter()
-        f.set_name("Images")
-        f.add_mime_type("image/*")
-        filters = Gio.ListStore.new(Gtk.FileFilter)
-        filters.append(f)
-        dialog.set_filters(filters)
-        dialog.open(self.get_root(), None, self._on_mask_picked)
+        self._pick_image("Select Mask Image", self._on_mask_picked)
 
     def _on_mask_picked(self, dialog, result) -> None:
         try:
@@ -809,10 +879,19 @@ class ControlPanel(Gtk.Box):
     # ------------------------------------------------------------------
 
     def _refresh_model_dropdown(self) -> None:
-        """Refresh the model dropdown for the current workflow."""
-        self._filtered_checkpoints = get_models_for_workflow(
-            self._all_checkpoints, self._current_workflow
-        )
+        """Refresh the model dropdown for the current workflow.
+
+        The dropdown model is only replaced when the filtered list differs
+        from what is already shown, which keeps the user's selection.
+        """
+        filtered = self._filter_cache.get(self._current_workflow)
+        if filtered is None:
+            filtered = get_models_for_workflow(self._all_checkpoints, self._current_workflow)
+            self._filter_cache[self._current_workflow] = filtered
+        self._filtered_checkpoints = filtered
+        if filtered == self._shown_checkpoints:
+            return
+        self._shown_checkpoints = filtered
         if self._filtered_checkpoints:
             self._model_dropdown.set_model(Gtk.StringList.new(self._filtered_checkpoints))
         else:
@@ -11,16 +11,26 @@ try:
 
     gi.require_version("Gtk", "4.0")
     gi.require_version("Adw", "1")
-    from gi.repository import Gdk, GdkPixbuf, Gtk, Pango
+    from gi.repository import Gdk, Gio, GLib, Gtk, Pango
 except (ImportError, ValueError):
     pass
 
 
+# Debounce window for batching gallery inserts
+_THUMB_FLUSH_MS = 50
+
+# Most recent thumbnails kept in the history gallery
+_GALLERY_LIMIT = 64
+
+
 class PreviewPanel(Gtk.Box):
     """Right-side panel containing the image preview, progress bar, gallery,
     and beginner tips.
     """
 
+    # Gallery thumbnail edge length in pixels
+    THUMB_SIZE = 80
+
     def __init__(self, **kwargs):
         super().__init__(orientation=Gtk.Orientation.VERTICAL, spacing=8, **kwargs)
         self.set_margin_start(8)
@@ -28,17 +38,26 @@ class PreviewPanel(Gtk.Box):
         self.set_margin_top(12)
         self.set_margin_bottom(12)
 
+        # Thumbnails waiting for the next batched gallery insert
+        self._pending_thumbs: list[Gdk.Texture] = []
+        self._thumb_flush_scheduled = False
+
         self._build_ui()
 
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
 
-    def show_image(self, pixbuf: GdkPixbuf.Pixbuf) -> None:
-        """Display a generated image (as a GdkPixbuf)."""
-        self._preview_picture.set_paintable(Gdk.Texture.new_for_pixbuf(pixbuf))
+    def show_image(self, texture: Gdk.Texture, thumbnail: Gdk.Texture) -> None:
+        """Display a generated image and add its thumbnail to the gallery.
+
+        Args:
+            texture: Full-size image.
+            thumbnail: Copy scaled to fit THUMB_SIZE.
+        """
+        self._preview_picture.set_paintable(texture)
         self._preview_stack.set_visible_child_name("preview")
-        self.add_to_gallery(pixbuf)
+        self.add_to_gallery(thumbnail)
 
     def set_progress(self, fraction: float, text: str = "") -> None:
         """Update the progress bar.
@@ -56,21 +75,44 @@ class PreviewPanel(Gtk.Box):
         """Show the placeholder instead of a preview image."""
         self._preview_stack.set_visible_child_name("placeholder")
 
-    def add_to_gallery(self, pixbuf: GdkPixbuf.Pixbuf) -> None:
-        """Add a thumbnail to the history gallery."""
-        size = 80
-        w, h = pixbuf.get_width(), pixbuf.get_height()
-        scale = size / max(w, h)
-        thumb = pixbuf.scale_simple(int(w * scale), int(h * scale), GdkPixbuf.InterpType.BILINEAR)
-        pic = Gtk.Picture(paintable=Gdk.Texture.new_for_pixbuf(thumb))
-        pic.set_size_request(size, size)
-        self._gallery_box.prepend(pic)
+    def add_to_gallery(self, thumbnail: Gdk.Texture) -> None:
+        """Add a thumbnail to the history gallery.
+
+        Thumbnails are queued and inserted together after a short debounce,
+        so a burst of completions relayouts the gallery once.
+        """
+        self._pending_thumbs.append(thumbnail)
+        if not self._thumb_flush_scheduled:
+            self._thumb_flush_scheduled = True
+            GLib.timeout_add(_THUMB_FLUSH_MS, self._flush_thumbs)
+
+    def _flush_thumbs(self) -> bool:
+        """Insert all queued thumbnails in one pass (GLib timeout callback).
+
+        Newest thumbnails go first, and the history is trimmed to
+        _GALLERY_LIMIT entries, so long sessions hold a bounded set of textures.
+        """
+        self._gallery_store.splice(0, 0, self._pending_thumbs[::-1])
+        excess = self._gallery_store.get_n_items() - _GALLERY_LIMIT
+        if excess > 0:
+            self._gallery_store.splice(_GALLERY_LIMIT, excess, [])
+        self._pending_thumbs.clear()
+        self._thumb_flush_scheduled = False
+        return False
 
     def reset(self) -> None:
         """Hide progress bar and reset state after generation."""
         self._progress_bar.set_visible(False)
         self._progress_bar.set_fraction(0)
 
+    def _on_thumb_setup(self, _factory, list_item) -> None:
+        pic = Gtk.Picture()
+        pic.set_size_request(self.THUMB_SIZE, self.THUMB_SIZE)
+        list_item.set_child(pic)
+
+    def _on_thumb_bind(self, _factory, list_item) -> None:
+        list_item.get_child().set_paintable(list_item.get_item())
+
     # ------------------------------------------------------------------
     # UI Building
     # ------------------------------------------------------------------
@@ -78,7 +120,7 @@ class PreviewPanel(Gtk.Box):
     def _build_ui(self) -> None:
         # Preview image
         frame = Gtk.Frame(vexpand=True)
-        self._preview_picture = Gtk.Picture(content_fit=Gtk.ContentFit.CONTAIN)
+        self._preview_picture = Gtk.Picture(content_fit=Gtk.ContentFit.SCALE_DOWN)
         placeholder = Gtk.Label(label="Select workflow and generate", css_classes=["dim-label"])
         self._preview_stack = Gtk.Stack()
         self._preview_stack.add_named(placeholder, "placeholder")
@@ -98,8 +140,17 @@ class PreviewPanel(Gtk.Box):
             vscrollbar_policy=Gtk.PolicyType.NEVER,
             min_content_height=90,
         )
-        self._gallery_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=6)
-        scroll.set_child(self._gallery_box)
+        # ListView only realizes Pictures for the visible thumbnails
+        self._gallery_store = Gio.ListStore(item_type=Gdk.Texture)
+        factory = Gtk.SignalListItemFactory()
+        factory.connect("setup", self._on_thumb_setup)
+        factory.connect("bind", self._on_thumb_bind)
+        gallery_view = Gtk.ListView(
+            model=Gtk.NoSelection(model=self._gallery_store),
+            factory=factory,
+            orientation=Gtk.Orientation.HORIZONTAL,
+        )
+        scroll.set_child(gallery_view)
         self.append(scroll)
 
         # Tips panel (collapsible)
@@ -50,7 +50,7 @@ def sample_model_info():
         filename="test_model.safetensors",
         size_mb=100,
         description="A test model",
-        required_for=["text2img"],
+        required_for=frozenset({"text2img"}),
     )
 
 
@@ -98,10 +98,12 @@ def mock_config(tmp_switchgen_root):
     """Create a mock Config with test paths."""
     from switchgen.core.config import Config, GenerationDefaults, MemoryConfig, PathConfig
 
-    # Create a PathConfig with mocked path detection
-    path_config = PathConfig.__new__(PathConfig)
-    path_config.switchgen_root = tmp_switchgen_root
-    path_config.comfy_path = tmp_switchgen_root / "vendor" / "ComfyUI"
+    # Create a PathConfig with explicit paths (skips detection)
+    path_config = PathConfig(
+        comfy_path=tmp_switchgen_root / "vendor" / "ComfyUI",
+        data_root=tmp_switchgen_root,
+        switchgen_root=tmp_switchgen_root,
+    )
 
     config = Config(
         paths=path_config,
@@ -24,10 +24,25 @@ class TestDetectSwitchgenRoot:
         result = _detect_switchgen_root()
         assert result.is_absolute()
 
+    def test_returns_same_instance(self):
+        """Should return the value resolved at import time."""
+        from switchgen.core.config import _detect_switchgen_root
+
+        assert _detect_switchgen_root() is _detect_switchgen_root()
+
 
 class TestDetectComfyPath:
     """Tests for _detect_comfy_path function."""
 
+    @pytest.fixture(autouse=True)
+    def _clear_detection_cache(self):
+        """Reset the memoized detection result around each test."""
+        from switchgen.core.config import _detect_comfy_path
+
+        _detect_comfy_path.cache_clear()
+        yield
+        _detect_comfy_path.cache_clear()
+
     def test_uses_bundled_path_when_exists(self, tmp_switchgen_root):
         """Should use bundled ComfyUI when it exists."""
         from switchgen.core.config import _detect_comfy_path
@@ -68,50 +83,71 @@ class TestDetectComfyPath:
             patch("switchgen.core.config._detect_switchgen_root", return_value=fake_root),
             patch.dict(os.environ, {"COMFYUI_PATH": ""}, clear=True),
         ):
-            with pytest.raises(RuntimeError, match="Bundled ComfyUI not found"):
+            with pytest.raises(RuntimeError, match="ComfyUI not found"):
                 _detect_comfy_path()
 
+    def test_result_is_cached(self, tmp_switchgen_root):
+        """Should only run detection once per process."""
+        from switchgen.core.config import _detect_comfy_path
+
+        with patch(
+            "switchgen.core.config._detect_switchgen_root", return_value=tmp_switchgen_root
+        ) as mock_root:
+            first = _detect_comfy_path()
+            second = _detect_comfy_path()
+
+        assert first is second
+        mock_root.assert_called_once()
+
 
 class TestPathConfig:
     """Tests for PathConfig dataclass."""
 
     def test_output_dir_property(self, tmp_switchgen_root):
-        """output_dir should be switchgen_root/output."""
+        """output_dir should be data_root/output."""
         from switchgen.core.config import PathConfig
 
-        config = PathConfig.__new__(PathConfig)
-        config.switchgen_root = tmp_switchgen_root
-        config.comfy_path = tmp_switchgen_root / "vendor" / "ComfyUI"
+        config = PathConfig(
+            comfy_path=tmp_switchgen_root / "vendor" / "ComfyUI",
+            data_root=tmp_switchgen_root,
+            switchgen_root=tmp_switchgen_root,
+        )
 
         assert config.output_dir == tmp_switchgen_root / "output"
 
     def test_temp_dir_property(self, tmp_switchgen_root):
-        """temp_dir should be switchgen_root/temp."""
+        """temp_dir should be data_root/temp."""
         from switchgen.core.config import PathConfig
 
-        config = PathConfig.__new__(PathConfig)
-        config.switchgen_root = tmp_switchgen_root
-        config.comfy_path = tmp_switchgen_root / "vendor" / "ComfyUI"
+        config = PathConfig(
+            comfy_path=tmp_switchgen_root / "vendor" / "ComfyUI",
+            data_root=tmp_switchgen_root,
+            switchgen_root=tmp_switchgen_root,
+        )
 
         assert config.temp_dir == tmp_switchgen_root / "temp"
 
     def test_workflows_dir_property(self, tmp_switchgen_root):
-        """workflows_dir should be switchgen_root/workflows."""
+        """workflows_dir should be data_root/workflows."""
         from switchgen.core.config import PathConfig
 
-        config = PathConfig.__new__(PathConfig)
-        config.switchgen_root = tmp_switchgen_root
-        config.comfy_path = tmp_switchgen_root / "vendor" / "ComfyUI"
+        config = PathConfig(
+            comfy_path=tmp_switchgen_root / "vendor" / "ComfyUI",
+            data_root=tmp_switchgen_root,
+            switchgen_root=tmp_switchgen_root,
+        )
 
         assert config.workflows_dir == tmp_switchgen_root / "workflows"
 
     def test_models_dir_property(self, tmp_switchgen_root):
-        """models_dir should be switchgen_root/models."""
+        """models_dir should be data_root/models."""
         from switchgen.core.config import PathConfig
 
-        config = PathConfig.__new__(PathConfig)
-        config.switchgen_root = tmp_switchgen_root
-        config.comfy_path = tmp_switchgen_root / "vendor" / "ComfyUI"
+        config = PathConfig(
+            comfy_path=tmp_switchgen_root / "vendor" / "ComfyUI",
+            data_root=tmp_switchgen_root,
+            switchgen_root=tmp_switchgen_root,
+        )
 
         assert config.models_dir == tmp_switchgen_root / "models"
 
@@ -119,9 +155,11 @@ class TestPathConfig:
         """checkpoints_dir should be models_dir/checkpoints."""
         from switchgen.core.config import PathConfig
 
-        config = PathConfig.__new__(PathConfig)
-        config.switchgen_root = tmp_switchgen_root
-        config.comfy_path = tmp_switchgen_root / "vendor" / "ComfyUI"
+        config = PathConfig(
+            comfy_path=tmp_switchgen_root / "vendor" / "ComfyUI",
+            data_root=tmp_switchgen_root,
+            switchgen_root=tmp_switchgen_root,
+        )
 
         assert config.checkpoints_dir == tmp_switchgen_root / "models" / "checkpoints"
 
@@ -132,15 +170,77 @@ class TestPathConfig:
         root = tmp_path / "new_root"
         root.mkdir()
 
-        config = PathConfig.__new__(PathConfig)
-        config.switchgen_root = root
-        config.comfy_path = root / "vendor" / "ComfyUI"
+        config = PathConfig(
+            comfy_path=root / "vendor" / "ComfyUI",
+            data_root=root,
+            switchgen_root=root,
+        )
 
         config.ensure_directories()
 
         assert (root / "output").exists()
         assert (root / "temp").exists()
         assert (root / "workflows").exists()
+        assert (root / "models" / "checkpoints").is_dir()
+        assert (root / "models" / "loras").is_dir()
+
+    def test_ensure_directories_skips_existing(self, tmp_path):
+        """ensure_directories should not mkdir when every directory exists."""
+        from switchgen.core.config import PathConfig
+
+        config = PathConfig(comfy_path=tmp_path, data_root=tmp_path, switchgen_root=tmp_path)
+        config.ensure_directories()
+
+        with patch("switchgen.core.config.os.makedirs") as mock_makedirs:
+            config.ensure_directories()
+
+        mock_makedirs.assert_not_called()
+
+    def test_derived_paths_computed_once(self, tmp_switchgen_root):
+        """Derived directories should be stored, not rebuilt on each access."""
+        from switchgen.core.config import PathConfig
+
+        config = PathConfig(
+            comfy_path=tmp_switchgen_root / "vendor" / "ComfyUI",
+            data_root=tmp_switchgen_root,
+            switchgen_root=tmp_switchgen_root,
+        )
+
+        assert config.models_dir is config.models_dir
+        assert config.custom_nodes_dir == tmp_switchgen_root / "vendor" / "ComfyUI" / "custom_nodes"
+
+    def test_roots_are_kept_as_configured(self, tmp_path):
+        """Symlinked roots should not be rewritten to their targets."""
+        from switchgen.core.config import PathConfig
+
+        (tmp_path / "real").mkdir()
+        link = tmp_path / "data"
+        link.symlink_to(tmp_path / "real")
+        config = PathConfig(
+            comfy_path=tmp_path / "ComfyUI",
+            data_root=link,
+            switchgen_root=tmp_path,
+        )
+
+        assert config.data_root == link
+        assert config.output_dir == link / "output"
+        assert config.custom_nodes_dir == tmp_path / "ComfyUI" / "custom_nodes"
+
+    def test_frozen_and_hashable(self, tmp_switchgen_root):
+        """PathConfig should reject mutation and be usable as a cache key."""
+        import dataclasses
+
+        from switchgen.core.config import PathConfig
+
+        config = PathConfig(
+            comfy_path=tmp_switchgen_root / "vendor" / "ComfyUI",
+            data_root=tmp_switchgen_root,
+            switchgen_root=tmp_switchgen_root,
+        )
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.data_root = tmp_switchgen_root / "elsewhere"
+        assert {config: 1}[config] == 1
 
 
 class TestMemoryConfig:
@@ -181,22 +281,26 @@ class TestConfig:
 
     def test_default_app_settings(self):
         """Should have correct default app settings."""
-        from switchgen.core.config import Config, GenerationDefaults, MemoryConfig
+        from switchgen.core.config import Config, GenerationDefaults, MemoryConfig, SessionState
 
-        # Create a minimal config for testing
-        config = Config.__new__(Config)
-        config.paths = MagicMock()
-        config.memory = MemoryConfig()
-        config.generation = GenerationDefaults()
-        config.app_id = "com.switchsides.switchgen"
-        config.app_name = "SwitchGen"
-        config.window_width = 1200
-        config.window_height = 800
+        with patch("switchgen.core.config.PathConfig") as MockPaths:
+            MockPaths.return_value = MagicMock()
+            config = Config()
 
+        assert isinstance(config.memory, MemoryConfig)
+        assert isinstance(config.generation, GenerationDefaults)
+        assert isinstance(config.session, SessionState)
         assert config.app_id == "com.switchsides.switchgen"
         assert config.app_name == "SwitchGen"
-        assert config.window_width == 1200
-        assert config.window_height == 800
+        assert config.session.window_width == 1200
+        assert config.session.window_height == 800
+
+    def test_config_is_slotted(self):
+        """Config dataclasses should use __slots__ instead of a per-instance __dict__."""
+        from switchgen.core.config import Config, GenerationDefaults, MemoryConfig, SessionState
+
+        for cls in (Config, MemoryConfig, GenerationDefaults, SessionState):
+            assert "__slots__" in cls.__dict__
 
 
 class TestConfigPersistence:
@@ -298,3 +402,34 @@ class TestGetConfig:
                 mock_load.assert_called_once()
         finally:
             config_module._config = original
+
+    def test_concurrent_first_calls_load_once(self):
+        """Concurrent first calls should share a single Config.load()."""
+        import threading
+        import time
+
+        from switchgen.core import config as config_module
+
+        original = config_module._config
+        config_module._config = None
+
+        def slow_load():
+            time.sleep(0.05)
+            return MagicMock()
+
+        try:
+            with patch.object(config_module.Config, "load", side_effect=slow_load) as mock_load:
+                results = []
+                threads = [
+                    threading.Thread(target=lambda: results.append(config_module.get_config()))
+                    for _ in range(4)
+                ]
+                for t in threads:
+                    t.start()
+                for t in threads:
+                    t.join()
+
+                mock_load.assert_called_once()
+                assert all(r is results[0] for r in results)
+        finally:
+            config_module._config = original
@@ -1,7 +1,10 @@
 """Unit tests for switchgen.core.downloader module."""
 
+import os
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 
 class TestDownloadProgress:
     """Tests for DownloadProgress dataclass."""
@@ -84,6 +87,36 @@ class TestDownloadProgress:
 
         assert progress.speed_mbps == 5.0
 
+    def test_is_frozen(self):
+        """DownloadProgress should be immutable once built."""
+        import dataclasses
+
+        from switchgen.core.downloader import DownloadProgress
+
+        p = DownloadProgress(model_id="test", downloaded_bytes=1, total_bytes=2, speed_bps=0)
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            p.downloaded_bytes = 2
+
+    def test_ema_filter_matches_recurrence(self):
+        """ema_filter should equal the live EMA recurrence."""
+        from switchgen.core.downloader import DownloadProgress
+
+        samples = [10.0, 20.0, 5.0, 40.0, 40.0, 0.0]
+        expected = [samples[0]]
+        for x in samples[1:]:
+            expected.append(0.3 * x + 0.7 * expected[-1])
+
+        result = DownloadProgress.ema_filter(samples)
+
+        assert result.tolist() == pytest.approx(expected)
+
+    def test_ema_filter_empty(self):
+        """ema_filter should accept an empty series."""
+        from switchgen.core.downloader import DownloadProgress
+
+        assert DownloadProgress.ema_filter([]).size == 0
+
     def test_eta_seconds_calculation(self):
         """eta_seconds should calculate remaining time correctly."""
         from switchgen.core.downloader import DownloadProgress
@@ -210,12 +243,15 @@ class TestModelDownloader:
     """Tests for ModelDownloader class."""
 
     def test_is_available(self, tmp_models_dir):
-        """is_available should return HF_AVAILABLE status."""
-        from switchgen.core.downloader import HF_AVAILABLE, ModelDownloader
+        """is_available should report whether huggingface_hub is installed."""
+        import importlib.util
+
+        from switchgen.core.downloader import ModelDownloader
 
         downloader = ModelDownloader(tmp_models_dir)
 
-        assert downloader.is_available() == HF_AVAILABLE
+        expected = importlib.util.find_spec("huggingface_hub") is not None
+        assert downloader.is_available() == expected
 
     def test_get_disk_space_mb(self, tmp_models_dir):
         """get_disk_space_mb should return (free, total) tuple."""
@@ -230,23 +266,50 @@ class TestModelDownloader:
         assert free_mb >= 0
         assert total_mb >= free_mb
 
+    def test_get_disk_space_mb_cached(self, tmp_models_dir):
+        """Readings should be reused within the TTL and refreshed after it."""
+        from switchgen.core.downloader import ModelDownloader
+
+        downloader = ModelDownloader(tmp_models_dir)
+
+        with (
+            patch("switchgen.core.downloader.os.statvfs", wraps=os.statvfs) as mock_statvfs,
+            patch("switchgen.core.downloader.time.monotonic", side_effect=[10.0, 10.5, 11.5]),
+        ):
+            downloader.get_disk_space_mb()
+            downloader.get_disk_space_mb()
+            assert mock_statvfs.call_count == 1
+
+            downloader.get_disk_space_mb()
+            assert mock_statvfs.call_count == 2
+
     def test_check_disk_space_sufficient(self, tmp_models_dir):
-        """check_disk_space should return True when space available."""
+        """check_disk_space should report True and the free space when it fits."""
         from switchgen.core.downloader import ModelDownloader
 
         downloader = ModelDownloader(tmp_models_dir)
 
         # 1MB should definitely be available
-        assert downloader.check_disk_space(1) is True
+        has_space, free_mb = downloader.check_disk_space(1)
+        assert has_space is True
+        assert free_mb == pytest.approx(downloader.get_disk_space_mb()[0], rel=0.01)
 
     def test_check_disk_space_insufficient(self, tmp_models_dir):
-        """check_disk_space should return False when space insufficient."""
+        """check_disk_space should report False when space insufficient."""
         from switchgen.core.downloader import ModelDownloader
 
         downloader = ModelDownloader(tmp_models_dir)
 
         # Request impossibly large size
-        assert downloader.check_disk_space(10_000_000_000) is False
+        has_space, _ = downloader.check_disk_space(10_000_000_000)
+        assert has_space is False
+
+    def test_has_room_for_keeps_headroom(self):
+        """has_room_for should require 500MB beyond the download size."""
+        from switchgen.core.downloader import ModelDownloader
+
+        assert ModelDownloader.has_room_for(1000, 1500) is True
+        assert ModelDownloader.has_room_for(1000, 1499) is False
 
     def test_get_installed_models_empty(self, tmp_models_dir):
         """get_installed_models should return empty list when no models."""
@@ -275,6 +338,20 @@ class TestModelDownloader:
 
         assert first_model.id in result
 
+    def test_get_installed_models_sees_new_files(self, tmp_models_dir):
+        """get_installed_models should not serve a stale cached result."""
+        from switchgen.core.downloader import ModelDownloader
+        from switchgen.core.models import MODEL_CATALOG
+
+        downloader = ModelDownloader(tmp_models_dir)
+        assert downloader.get_installed_models() == []
+
+        first_model = next(iter(MODEL_CATALOG.values()))
+        model_dir = tmp_models_dir / first_model.type.value
+        (model_dir / first_model.get_local_filename()).touch()
+
+        assert first_model.id in downloader.get_installed_models()
+
     def test_is_downloading_initially_false(self, tmp_models_dir):
         """is_downloading should be False initially."""
         from switchgen.core.downloader import ModelDownloader
@@ -296,8 +373,8 @@ class TestModelDownloader:
         from switchgen.core import downloader as downloader_module
         from switchgen.core.downloader import ModelDownloader
 
-        # Mock HF_AVAILABLE as False
-        with patch.object(downloader_module, "HF_AVAILABLE", False):
+        # Mock huggingface_hub as unavailable
+        with patch.object(downloader_module, "_hf_available", return_value=False):
             dl = ModelDownloader(tmp_models_dir)
             result = dl.download(sample_model_info)
 
@@ -306,25 +383,450 @@ class TestModelDownloader:
 
     def test_download_checks_disk_space(self, tmp_models_dir, sample_model_info):
         """download should check disk space before downloading."""
+        import dataclasses
+
         from switchgen.core.downloader import ModelDownloader
 
         downloader = ModelDownloader(tmp_models_dir)
 
         # Request huge file
-        sample_model_info.size_mb = 10_000_000_000
+        huge = dataclasses.replace(sample_model_info, size_mb=10_000_000_000)
 
-        result = downloader.download(sample_model_info)
+        result = downloader.download(huge)
 
         assert result.success is False
         assert "disk space" in result.error.lower()
 
+    def test_download_queries_disk_space_once(self, tmp_models_dir, sample_model_info):
+        """download should reuse the free-space figure from the check in its error."""
+        from switchgen.core.downloader import ModelDownloader
+
+        downloader = ModelDownloader(tmp_models_dir)
+
+        with patch.object(downloader, "get_disk_space_mb", return_value=(100.0, 1000.0)) as mock:
+            result = downloader.download(sample_model_info)
+
+        assert result.success is False
+        assert "have 100MB free" in result.error
+        mock.assert_called_once()
+
+    def _mock_response(self, chunks, content_length):
+        response = MagicMock()
+        response.headers = {"content-length": str(content_length)}
+        response.iter_content.return_value = chunks
+        return response
+
+    def _mock_hf(self, cached=None):
+        return {
+            "hf_hub_url": MagicMock(return_value="https://hf"),
+            "build_hf_headers": dict,
+            "try_to_load_from_cache": MagicMock(return_value=cached),
+        }
+
+    def test_download_links_from_hf_cache(self, tmp_path, tmp_models_dir, sample_model_info):
+        """A file already in the HF cache should be hard-linked, not downloaded."""
+        from switchgen.core import downloader as downloader_module
+        from switchgen.core.downloader import ModelDownloader
+
+        cached = tmp_path / "blob"
+        cached.write_bytes(b"cached")
+        downloader = ModelDownloader(tmp_models_dir)
+
+        with (
+            patch.object(downloader_module, "_get_hf", return_value=self._mock_hf(str(cached))),
+            patch("requests.Session.get") as mock_get,
+        ):
+            result = downloader.download(sample_model_info)
+
+        assert result.success is True
+        assert result.path.read_bytes() == b"cached"
+        assert os.path.samefile(result.path, cached)
+        mock_get.assert_not_called()
+
+    def test_download_streams_to_target(self, tmp_models_dir, sample_model_info):
+        """download should write the streamed chunks and report the final size."""
+        from switchgen.core import downloader as downloader_module
+        from switchgen.core.downloader import ModelDownloader
+
+        downloader = ModelDownloader(tmp_models_dir)
+        updates = []
+        response = self._mock_response([b"abc", b"def"], 6)
+
+        with (
+            patch.object(downloader_module, "_get_hf", return_value=self._mock_hf()),
+            patch("requests.Session.get", return_value=response),
+        ):
+            result = downloader.download(sample_model_info, updates.append)
+
+        assert result.success is True
+        assert result.path.read_bytes() == b"abcdef"
+        assert updates[-1].downloaded_bytes == 6
+        assert updates[-1].progress == 1.0
+
+    @pytest.mark.skipif(not hasattr(os, "posix_fadvise"), reason="needs posix_fadvise")
+    def test_download_drops_page_cache(self, tmp_models_dir, sample_model_info):
+        """A finished download should be flushed, then advised out of the page cache."""
+        from switchgen.core import downloader as downloader_module
+        from switchgen.core.downloader import ModelDownloader
+
+        downloader = ModelDownloader(tmp_models_dir)
+        response = self._mock_response([b"abc"], 3)
+        calls = MagicMock()
+
+        with (
+            patch.object(downloader_module, "_get_hf", return_value=self._mock_hf()),
+            patch("requests.Session.get", return_value=response),
+            patch.object(downloader_module.os, "fdatasync", calls.fdatasync),
+            patch.object(downloader_module, "_fadvise", calls.fadvise),
+        ):
+            result = downloader.download(sample_model_info)
+
+        assert result.success is True
+        assert [c[0] for c in calls.mock_calls] == ["fdatasync", "fadvise"]
+        assert calls.fadvise.call_args.args[1] == os.POSIX_FADV_DONTNEED
+
+    @pytest.mark.skipif(not hasattr(os, "posix_fadvise"), reason="needs posix_fadvise")
+    def test_download_survives_page_cache_errors(self, tmp_models_dir, sample_model_info):
+        """A failing page-cache hint should not fail a finished download."""
+        from switchgen.core import downloader as downloader_module
+        from switchgen.core.downloader import ModelDownloader
+
+        downloader = ModelDownloader(tmp_models_dir)
+        response = self._mock_response([b"abc"], 3)
+
+        with (
+            patch.object(downloader_module, "_get_hf", return_value=self._mock_hf()),
+            patch("requests.Session.get", return_value=response),
+            patch.object(downloader_module.os, "fdatasync", side_effect=OSError("EIO")),
+        ):
+            result = downloader.download(sample_model_info)
+
+        assert result.success is True
+        assert result.path.read_bytes() == b"abc"
+
+    def test_download_replaces_existing_file(self, tmp_models_dir, sample_model_info):
+        """download should atomically overwrite a previous copy of the model."""
+        from switchgen.core import downloader as downloader_module
+        from switchgen.core.downloader import ModelDownloader
+
+        target_dir = tmp_models_dir / sample_model_info.type.value
+        target_dir.mkdir(exist_ok=True)
+        (target_dir / sample_model_info.get_local_filename()).write_bytes(b"old")
+        downloader = ModelDownloader(tmp_models_dir)
+        response = self._mock_response([b"new"], 3)
+
+        with (
+            patch.object(downloader_module, "_get_hf", return_value=self._mock_hf()),
+            patch("requests.Session.get", return_value=response),
+        ):
+            result = downloader.download(sample_model_info)
+
+        assert result.success is True
+        assert result.path.read_bytes() == b"new"
+        assert sorted(p.name for p in target_dir.iterdir()) == [result.path.name]
+
+    def _fake_hf_transfer(self, payload):
+        import types
+
+        def download(url, filename, callback, **kwargs):
+            with open(filename, "wb") as f:
+                for byte in payload:
+                    f.write(bytes([byte]))
+                    callback(1)
+
+        return types.SimpleNamespace(download=download)
+
+    def test_download_with_hf_transfer(self, tmp_models_dir, sample_model_info):
+        """download should hand the resolved URL to hf_transfer when enabled."""
+        import sys
+
+        from switchgen.core import downloader as downloader_module
+        from switchgen.core.downloader import ModelDownloader
+
+        downloader = ModelDownloader(tmp_models_dir)
+        head = MagicMock(url="https://cdn/file", headers={"content-length": "4"})
+        updates = []
+
+        with (
+            patch.object(downloader_module, "_get_hf", return_value=self._mock_hf()),
+            patch("requests.Session.head", return_value=head),
+            patch.dict(sys.modules, {"hf_transfer": self._fake_hf_transfer(b"data")}),
+        ):
+            result = downloader.download(sample_model_info, updates.append, use_hf_transfer=True)
+
+        assert result.success is True
+        assert result.path.read_bytes() == b"data"
+        assert updates[-1].downloaded_bytes == 4
+
+    def test_hf_transfer_drops_token_for_cdn(self, tmp_models_dir, sample_model_info):
+        """The Hub token should not be forwarded to a different CDN host."""
+        import sys
+        import types
+
+        from switchgen.core import downloader as downloader_module
+        from switchgen.core.downloader import ModelDownloader
+
+        downloader = ModelDownloader(tmp_models_dir)
+        head = MagicMock(url="https://cdn/file", headers={"content-length": "4"})
+        hf = self._mock_hf()
+        hf["build_hf_headers"] = lambda: {"authorization": "Bearer hf_x", "user-agent": "ua"}
+        sent = {}
+
+        def download(url, filename, callback, headers, **kwargs):
+            sent.update(headers)
+            with open(filename, "wb") as f:
+                f.write(b"data")
+            callback(4)
+
+        with (
+            patch.object(downloader_module, "_get_hf", return_value=hf),
+            patch("requests.Session.head", return_value=head),
+            patch.dict(sys.modules, {"hf_transfer": types.SimpleNamespace(download=download)}),
+        ):
+            result = downloader.download(sample_model_info, use_hf_transfer=True)
+
+        assert result.success is True
+        assert sent == {"user-agent": "ua"}
+
+    def test_hf_transfer_cancel(self, tmp_models_dir, sample_model_info):
+        """Cancelling should abort an hf_transfer download and clean up."""
+        import sys
+        import types
+
+        from switchgen.core import downloader as downloader_module
+        from switchgen.core.downloader import ModelDownloader
+
+        downloader = ModelDownloader(tmp_models_dir)
+        head = MagicMock(url="https://cdn/file", headers={"content-length": "4"})
+
+        def download(url, filename, callback, **kwargs):
+            downloader.cancel_download()
+            try:
+                callback(1)
+            except Exception as e:
+                raise RuntimeError("wrapped by hf_transfer") from e
+
+        with (
+            patch.object(downloader_module, "_get_hf", return_value=self._mock_hf()),
+            patch("requests.Session.head", return_value=head),
+            patch.dict(sys.modules, {"hf_transfer": types.SimpleNamespace(download=download)}),
+        ):
+            result = downloader.download(sample_model_info, use_hf_transfer=True)
+
+        assert result.success is False
+        assert result.error == "Download cancelled"
+
+    def _range_server(self, payload, status_code=206):
+        def get(*args, headers, **kwargs):
+            start, end = map(int, headers["Range"].removeprefix("bytes=").split("-"))
+            response = MagicMock(status_code=status_code)
+            response.__enter__.return_value = response
+            response.iter_content.return_value = [payload[start : end + 1]]
+            responses.append(response)
+            return response
+
+        responses = []
+
+        head = MagicMock(
+            url="https://cdn/file",
+            headers={"content-length": str(len(payload)), "accept-ranges": "bytes"},
+        )
+        return head, get, responses
+
+    def test_range_download_reassembles_slices(self, tmp_models_dir, sample_model_info):
+        """Large files should be fetched as Range slices and written in place."""
+        from switchgen.core import downloader as downloader_module
+        from switchgen.core.downloader import ModelDownloader
+
+        payload = bytes(range(256)) * 40
+        head, get, _ = self._range_server(payload)
+        downloader = ModelDownloader(tmp_models_dir)
+        updates = []
+
+        with (
+            patch.object(downloader_module, "_RANGE_MIN_SIZE", 1),
+            patch.object(downloader_module, "_get_hf", return_value=self._mock_hf()),
+            patch("requests.Session.head", return_value=head),
+            patch("requests.Session.get", side_effect=get) as mock_get,
+        ):
+            result = downloader.download(sample_model_info, updates.append, use_hf_transfer=False)
+
+        assert result.success is True
+        assert result.path.read_bytes() == payload
+        assert mock_get.call_count == downloader_module._RANGE_CONNECTIONS
+        assert updates[-1].downloaded_bytes == len(payload)
+
+    def test_range_download_session_per_worker(self, tmp_models_dir, sample_model_info):
+        """Range slices should not share one Session across worker threads."""
+        import threading
+
+        from switchgen.core import downloader as downloader_module
+        from switchgen.core.downloader import ModelDownloader
+
+        payload = bytes(range(256)) * 40
+        head, get, _ = self._range_server(payload)
+        downloader = ModelDownloader(tmp_models_dir)
+        sessions = set()
+
+        def tracking_get(session, *args, **kwargs):
+            sessions.add((threading.get_ident(), id(session)))
+            return get(*args, **kwargs)
+
+        with (
+            patch.object(downloader_module, "_RANGE_MIN_SIZE", 1),
+            patch.object(downloader_module, "_get_hf", return_value=self._mock_hf()),
+            patch("requests.Session.head", return_value=head),
+            patch("requests.Session.get", autospec=True, side_effect=tracking_get),
+        ):
+            result = downloader.download(sample_model_info, use_hf_transfer=False)
+
+        assert result.success is True
+        # Each thread maps to exactly one session, and no session spans threads
+        assert len({tid for tid, _ in sessions}) == len({sid for _, sid in sessions})
+
+    def test_range_download_rejects_ignored_range(self, tmp_models_dir, sample_model_info):
+        """A server answering 200 to a Range request should fail the download."""
+        from switchgen.core import downloader as downloader_module
+        from switchgen.core.downloader import ModelDownloader
+
+        head, get, responses = self._range_server(b"x" * 4096, status_code=200)
+        downloader = ModelDownloader(tmp_models_dir)
+
+        with (
+            patch.object(downloader_module, "_RANGE_MIN_SIZE", 1),
+            patch.object(downloader_module, "_get_hf", return_value=self._mock_hf()),
+            patch("requests.Session.head", return_value=head),
+            patch("requests.Session.get", side_effect=get),
+        ):
+            result = downloader.download(sample_model_info, use_hf_transfer=False)
+
+        assert result.success is False
+        assert "Range" in result.error
+        assert not list((tmp_models_dir / sample_model_info.type.value).glob("*.tmp"))
+        assert all(r.__exit__.called for r in responses)
+
+    def test_session_is_reused(self, tmp_models_dir):
+        """The HTTP session should be created once per thread and reused."""
+        from switchgen.core.downloader import ModelDownloader
+
+        downloader = ModelDownloader(tmp_models_dir)
+
+        assert downloader._get_session() is downloader._get_session()
+
+    def test_session_is_per_thread(self, tmp_models_dir):
+        """Concurrent download threads should not share a Session."""
+        import threading
+
+        from switchgen.core.downloader import ModelDownloader
+
+        downloader = ModelDownloader(tmp_models_dir)
+        other = []
+        thread = threading.Thread(target=lambda: other.append(downloader._get_session()))
+        thread.start()
+        thread.join()
+
+        assert other[0] is not downloader._get_session()
+
+    def test_download_hashes_while_streaming(self, tmp_models_dir, sample_model_info):
+        """A streamed download should be verified without re-reading the file."""
+        import dataclasses
+        import hashlib
+
+        from switchgen.core import downloader as downloader_module
+        from switchgen.core.downloader import ModelDownloader
+
+        info = dataclasses.replace(sample_model_info, sha256=hashlib.sha256(b"abcdef").hexdigest())
+        downloader = ModelDownloader(tmp_models_dir)
+        response = self._mock_response([b"abc", b"def"], 6)
+
+        with (
+            patch.object(downloader_module, "_get_hf", return_value=self._mock_hf()),
+            patch("requests.Session.get", return_value=response),
+            patch.object(downloader_module, "_file_sha256") as mock_file_hash,
+        ):
+            result = downloader.download(info, use_hf_transfer=False)
+
+        assert result.success is True
+        mock_file_hash.assert_not_called()
+
+    def test_download_rejects_checksum_mismatch(self, tmp_models_dir, sample_model_info):
+        """A streamed download with the wrong hash should fail and clean up."""
+        import dataclasses
+
+        from switchgen.core import downloader as downloader_module
+        from switchgen.core.downloader import ModelDownloader
+
+        info = dataclasses.replace(sample_model_info, sha256="0" * 64)
+        downloader = ModelDownloader(tmp_models_dir)
+        response = self._mock_response([b"abc"], 3)
+
+        with (
+            patch.object(downloader_module, "_get_hf", return_value=self._mock_hf()),
+            patch("requests.Session.get", return_value=response),
+        ):
+            result = downloader.download(info, use_hf_transfer=False)
+
+        assert result.success is False
+        assert "Checksum mismatch" in result.error
+        assert list((tmp_models_dir / info.type.value).iterdir()) == []
+
+    def test_download_rejects_incomplete_file(self, tmp_models_dir, sample_model_info):
+        """download should fail and clean up when fewer bytes arrive than advertised."""
+        from switchgen.core import downloader as downloader_module
+        from switchgen.core.downloader import ModelDownloader
+
+        downloader = ModelDownloader(tmp_models_dir)
+        response = self._mock_response([b"abc"], 1000)
+
+        with (
+            patch.object(downloader_module, "_get_hf", return_value=self._mock_hf()),
+            patch("requests.Session.get", return_value=response),
+        ):
+            result = downloader.download(sample_model_info)
+
+        assert result.success is False
+        assert "incomplete" in result.error.lower()
+        assert list((tmp_models_dir / sample_model_info.type.value).iterdir()) == []
+
+
+class TestProgressReporter:
+    """Tests for the rate-limited progress reporter."""
+
+    def test_small_chunks_skip_clock(self):
+        """Updates below the byte threshold should not read the clock."""
+        from switchgen.core.downloader import _PROGRESS_MIN_BYTES, _ProgressReporter
+
+        updates = []
+        reporter = _ProgressReporter("m", 10 * _PROGRESS_MIN_BYTES, updates.append)
+
+        with patch("switchgen.core.downloader.time.monotonic_ns") as mock_time:
+            reporter.advance(_PROGRESS_MIN_BYTES // 4)
+            reporter.advance(_PROGRESS_MIN_BYTES // 4)
+
+        mock_time.assert_not_called()
+        assert reporter.downloaded == _PROGRESS_MIN_BYTES // 2
+        assert len(updates) == 1  # only the initial update
+
+    def test_emits_after_interval(self):
+        """Updates should be emitted once enough bytes and time have passed."""
+        from switchgen.core.downloader import _PROGRESS_MIN_BYTES, _ProgressReporter
+
+        updates = []
+        with patch("switchgen.core.downloader.time.monotonic_ns", return_value=100_000_000_000):
+            reporter = _ProgressReporter("m", 4 * _PROGRESS_MIN_BYTES, updates.append)
+        with patch("switchgen.core.downloader.time.monotonic_ns", return_value=101_000_000_000):
+            reporter.advance(_PROGRESS_MIN_BYTES)
+
+        assert updates[-1].downloaded_bytes == _PROGRESS_MIN_BYTES
+        assert updates[-1].speed_bps == _PROGRESS_MIN_BYTES
+
 
 class TestModelDownloaderAsync:
     """Tests for async download functionality."""
 
-    def test_download_async_returns_thread(self, tmp_models_dir, sample_model_info):
-        """download_async should return a Thread object."""
-        import threading
+    def test_download_async_returns_future(self, tmp_models_dir, sample_model_info):
+        """download_async should return a Future for the download result."""
+        from concurrent.futures import Future
 
         from switchgen.core.downloader import ModelDownloader
 
@@ -334,10 +836,10 @@ class TestModelDownloaderAsync:
         with patch.object(downloader, "download") as mock_download:
             mock_download.return_value = MagicMock(success=True)
 
-            thread = downloader.download_async(sample_model_info)
+            future = downloader.download_async(sample_model_info)
 
-            assert isinstance(thread, threading.Thread)
-            thread.join(timeout=1.0)
+            assert isinstance(future, Future)
+            assert future.result(timeout=1.0) is mock_download.return_value
 
     def test_download_async_calls_complete_callback(self, tmp_models_dir, sample_model_info):
         """download_async should call complete_callback when done."""
@@ -353,21 +855,202 @@ class TestModelDownloaderAsync:
             mock_result = DownloadResult(success=True, model_id="test")
             mock_download.return_value = mock_result
 
-            thread = downloader.download_async(
+            future = downloader.download_async(
                 sample_model_info,
                 complete_callback=on_complete,
             )
-            thread.join(timeout=1.0)
+            future.result(timeout=1.0)
 
         assert len(callback_called) == 1
         assert callback_called[0] == mock_result
 
     def test_cancel_download_sets_flag(self, tmp_models_dir):
-        """cancel_download should set the cancel flag."""
+        """cancel_download with no ID should cancel every active download."""
+        import threading
+
         from switchgen.core.downloader import ModelDownloader
 
         downloader = ModelDownloader(tmp_models_dir)
+        tokens = {"a": threading.Event(), "b": threading.Event()}
+        downloader._active.update(tokens)
 
         downloader.cancel_download()
 
-        assert downloader._cancel_requested is True
+        assert all(t.is_set() for t in tokens.values())
+
+    def test_cancel_download_by_id(self, tmp_models_dir):
+        """cancel_download with an ID should only cancel that download."""
+        import threading
+
+        from switchgen.core.downloader import ModelDownloader
+
+        downloader = ModelDownloader(tmp_models_dir)
+        tokens = {"a": threading.Event(), "b": threading.Event()}
+        downloader._active.update(tokens)
+
+        downloader.cancel_download("a")
+        downloader.cancel_download("missing")
+
+        assert tokens["a"].is_set()
+        assert not tokens["b"].is_set()
+
+    def test_shutdown_cancels_and_rejects_new_work(self, tmp_models_dir, sample_model_info):
+        """shutdown should signal cancellation and stop accepting downloads."""
+        import threading
+
+        from switchgen.core.downloader import ModelDownloader
+
+        downloader = ModelDownloader(tmp_models_dir)
+        token = threading.Event()
+        downloader._active["a"] = token
+
+        downloader.shutdown()
+
+        assert token.is_set()
+        with pytest.raises(RuntimeError):
+            downloader.download_async(sample_model_info)
+
+
+class TestModelDownloaderMany:
+    """Tests for concurrent multi-model downloads."""
+
+    def test_download_many_empty(self, tmp_models_dir):
+        """download_many with no models should return an empty list."""
+        from switchgen.core.downloader import ModelDownloader
+
+        assert ModelDownloader(tmp_models_dir).download_many([]) == []
+
+    def test_download_many_runs_concurrently_in_order(self, tmp_models_dir, sample_model_info):
+        """download_many should overlap downloads and keep results in input order."""
+        import dataclasses
+        import threading
+
+        from switchgen.core.downloader import DownloadResult, ModelDownloader
+
+        downloader = ModelDownloader(tmp_models_dir)
+        infos = [dataclasses.replace(sample_model_info, id=f"m{i}") for i in range(3)]
+        barrier = threading.Barrier(3, timeout=2.0)
+
+        def fake_download(info, _callback):
+            barrier.wait()  # only passes if all three run at once
+            return DownloadResult(success=True, model_id=info.id)
+
+        with patch.object(downloader, "download", side_effect=fake_download):
+            results = downloader.download_many(infos, max_workers=3)
+
+        assert [r.model_id for r in results] == ["m0", "m1", "m2"]
+        assert all(r.success for r in results)
+
+    async def test_download_aio_runs_concurrently(self, tmp_models_dir, sample_model_info):
+        """download_aio calls gathered together should overlap."""
+        import asyncio
+        import dataclasses
+        import threading
+
+        from switchgen.core.downloader import DownloadResult, ModelDownloader
+
+        downloader = ModelDownloader(tmp_models_dir)
+        infos = [dataclasses.replace(sample_model_info, id=f"m{i}") for i in range(2)]
+        barrier = threading.Barrier(2, timeout=2.0)
+
+        def fake_download(info, callback):
+            barrier.wait()
+            return DownloadResult(success=True, model_id=info.id)
+
+        with patch.object(downloader, "download", side_effect=fake_download):
+            results = await asyncio.gather(*(downloader.download_aio(m) for m in infos))
+
+        assert [r.model_id for r in results] == ["m0", "m1"]
+        assert all(r.success for r in results)
+
+    async def test_download_aio_reports_exceptions(self, tmp_models_dir, sample_model_info):
+        """Exceptions raised by download should come back as failed results."""
+        from switchgen.core.downloader import ModelDownloader
+
+        downloader = ModelDownloader(tmp_models_dir)
+        with patch.object(downloader, "download", side_effect=RuntimeError("boom")):
+            result = await downloader.download_aio(sample_model_info)
+
+        assert result.success is False
+        assert result.error == "boom"
+
+    def test_download_queue_overlaps_at_threshold(self, tmp_models_dir, sample_model_info):
+        """The next queued download should start once the current one passes 75%."""
+        import dataclasses
+        import threading
+
+        from switchgen.core.downloader import DownloadProgress, DownloadResult, ModelDownloader
+
+        downloader = ModelDownloader(tmp_models_dir)
+        infos = [dataclasses.replace(sample_model_info, id=f"m{i}") for i in range(2)]
+        second_started = threading.Event()
+        overlapped = []
+
+        def fake_download(info, callback):
+            if info.id == "m0":
+                callback(DownloadProgress("m0", 80, 100, 1.0))
+                overlapped.append(second_started.wait(timeout=2.0))
+            else:
+                second_started.set()
+            return DownloadResult(success=True, model_id=info.id)
+
+        with patch.object(downloader, "download", side_effect=fake_download):
+            results = downloader.download_queue(infos)
+
+        assert overlapped == [True]
+        assert [r.model_id for r in results] == ["m0", "m1"]
+
+    def test_download_queue_stops_on_cancel(self, tmp_models_dir, sample_model_info):
+        """A cancelled download should stop the rest of the queue."""
+        import dataclasses
+
+        from switchgen.core.downloader import DownloadResult, ModelDownloader
+
+        downloader = ModelDownloader(tmp_models_dir)
+        infos = [dataclasses.replace(sample_model_info, id=f"m{i}") for i in range(3)]
+
+        def fake_download(info, callback):
+            return DownloadResult(success=False, model_id=info.id, error="Download cancelled")
+
+        with patch.object(downloader, "download", side_effect=fake_download) as mock_download:
+            results = downloader.download_queue(infos)
+
+        assert mock_download.call_count == 1
+        assert [r.model_id for r in results] == ["m0", "m1", "m2"]
+        assert all(r.error == "Download cancelled" for r in results)
+
+    def test_download_many_reports_exceptions(self, tmp_models_dir, sample_model_info):
+        """An exception in one download should become a failed result."""
+        from switchgen.core.downloader import ModelDownloader
+
+        downloader = ModelDownloader(tmp_models_dir)
+
+        with patch.object(downloader, "download", side_effect=OSError("boom")):
+            results = downloader.download_many([sample_model_info])
+
+        assert results[0].success is False
+        assert results[0].error == "boom"
+
+    def test_rejects_duplicate_in_flight_download(self, tmp_models_dir, sample_model_info):
+        """A model already downloading should not be started a second time."""
+        import threading
+
+        from switchgen.core.downloader import ModelDownloader
+
+        downloader = ModelDownloader(tmp_models_dir)
+        downloader._active[sample_model_info.id] = threading.Event()
+
+        result = downloader.download(sample_model_info)
+
+        assert result.success is False
+        assert "already" in result.error
+
+    def test_parallel_workers_env_override(self, monkeypatch):
+        """HF_PARALLEL_DOWNLOADING_WORKERS should override the default worker count."""
+        from switchgen.core.downloader import _DEFAULT_PARALLEL_WORKERS, _parallel_workers
+
+        monkeypatch.setenv("HF_PARALLEL_DOWNLOADING_WORKERS", "3")
+        assert _parallel_workers() == 3
+
+        monkeypatch.setenv("HF_PARALLEL_DOWNLOADING_WORKERS", "lots")
+        assert _parallel_workers() == _DEFAULT_PARALLEL_WORKERS
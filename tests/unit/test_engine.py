@@ -310,6 +310,28 @@ class TestTensorToPil:
         assert isinstance(result[0], Image.Image)
 
 
+class TestTensorToUint8:
+    """Tests for tensor_to_uint8 function."""
+
+    def test_returns_none_for_none(self):
+        """Should return None for None input."""
+        from switchgen.core.engine import tensor_to_uint8
+
+        assert tensor_to_uint8(None) is None
+
+    def test_scales_batch_to_uint8(self):
+        """Should scale [0, 1] floats to a contiguous uint8 batch."""
+        from switchgen.core.engine import tensor_to_uint8
+
+        array = np.array([[[[0.0, 0.5, 1.0]]]])
+
+        result = tensor_to_uint8(array)
+
+        assert result.dtype == np.uint8
+        assert result.flags["C_CONTIGUOUS"]
+        assert result.tolist() == [[[[0, 127, 255]]]]
+
+
 class TestGetEngine:
     """Tests for get_engine singleton function."""
 
@@ -1,5 +1,7 @@
 """Unit tests for switchgen.core.models module."""
 
+import pytest
+
 
 class TestModelType:
     """Tests for ModelType enum."""
@@ -59,8 +61,49 @@ class TestModelInfo:
 
         assert model.get_local_filename() == "original.safetensors"
 
+    def test_frozen_and_hashable(self):
+        """ModelInfo should be immutable and usable in sets."""
+        import dataclasses
+
+        from switchgen.core.models import ModelInfo, ModelType
+
+        model = ModelInfo(
+            id="test",
+            name="Test",
+            type=ModelType.VAE,
+            repo_id="test/repo",
+            filename="test.safetensors",
+            size_mb=1,
+            description="Test",
+            required_for=frozenset({"text2img"}),
+        )
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            model.size_mb = 2
+        assert model in {model}
+
+    def test_replace_recomputes_local_filename(self, sample_model_info):
+        """dataclasses.replace should re-resolve the local filename."""
+        import dataclasses
+
+        model = dataclasses.replace(sample_model_info, local_filename="renamed.safetensors")
+
+        assert model.get_local_filename() == "renamed.safetensors"
+        assert sample_model_info.get_local_filename() == sample_model_info.filename
+
+    def test_display_labels(self, sample_model_info):
+        """Size and VRAM labels should be formatted for display."""
+        import dataclasses
+
+        small = dataclasses.replace(sample_model_info, size_mb=512, vram_gb=6.0)
+        large = dataclasses.replace(sample_model_info, size_mb=2048)
+
+        assert small.size_label == "512 MB"
+        assert small.vram_label == "6GB VRAM"
+        assert large.size_label == "2.0 GB"
+
     def test_required_for_default(self):
-        """required_for should default to empty list."""
+        """required_for should default to an empty frozenset."""
         from switchgen.core.models import ModelInfo, ModelType
 
         model = ModelInfo(
@@ -73,7 +116,7 @@ class TestModelInfo:
             description="Test model",
         )
 
-        assert model.required_for == []
+        assert model.required_for == frozenset()
 
 
 class TestModelCatalog:
@@ -141,6 +184,27 @@ class TestGetModelsByType:
 
         assert all(m.type == ModelType.CONTROLNET for m in result)
 
+    def test_result_is_cached(self):
+        """Repeated calls should return the same immutable result."""
+        from switchgen.core.models import ModelType, get_models_by_type
+
+        result = get_models_by_type(ModelType.CHECKPOINT)
+
+        assert isinstance(result, tuple)
+        assert get_models_by_type(ModelType.CHECKPOINT) is result
+
+
+class TestTotalSizeByType:
+    """Tests for total_size_by_type function."""
+
+    def test_matches_python_sum(self):
+        """Should equal the summed size of each type's models."""
+        from switchgen.core.models import ModelType, get_models_by_type, total_size_by_type
+
+        for model_type in ModelType:
+            expected = sum(m.size_mb for m in get_models_by_type(model_type))
+            assert total_size_by_type(model_type) == expected
+
 
 class TestGetRequiredModels:
     """Tests for get_required_models function."""
@@ -173,12 +237,21 @@ class TestGetRequiredModels:
         assert all("3d" in m.required_for for m in result)
 
     def test_unknown_workflow_returns_empty(self):
-        """Should return empty list for unknown workflow type."""
+        """Should return an empty tuple for unknown workflow type."""
         from switchgen.core.models import get_required_models
 
         result = get_required_models("nonexistent_workflow")
 
-        assert result == []
+        assert result == ()
+
+    def test_result_is_cached(self):
+        """Repeated calls should return the same immutable result."""
+        from switchgen.core.models import get_required_models
+
+        result = get_required_models("text2img")
+
+        assert isinstance(result, tuple)
+        assert get_required_models("text2img") is result
 
 
 class TestGetModelInfo:
@@ -251,3 +324,29 @@ class TestIsModelInstalled:
         result = is_model_installed(model, tmp_models_dir)
 
         assert result is True
+
+
+class TestInstalledSet:
+    """Tests for installed_set function."""
+
+    def test_empty_when_nothing_installed(self, tmp_models_dir):
+        """Should return an empty set when no model files exist."""
+        from switchgen.core.models import installed_set
+
+        assert installed_set(tmp_models_dir) == set()
+
+    def test_finds_installed_models(self, tmp_models_dir):
+        """Should report catalog models whose local file exists."""
+        from switchgen.core.models import MODEL_CATALOG, installed_set
+
+        model = MODEL_CATALOG["sdxl_vae"]
+        (tmp_models_dir / model.type.value / model.get_local_filename()).touch()
+        (tmp_models_dir / model.type.value / "nested").mkdir()
+
+        assert installed_set(tmp_models_dir) == {"sdxl_vae"}
+
+    def test_missing_models_dir(self, tmp_path):
+        """Should tolerate a models directory that does not exist."""
+        from switchgen.core.models import installed_set
+
+        assert installed_set(tmp_path / "missing") == set()